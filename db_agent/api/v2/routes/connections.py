@@ -142,11 +142,11 @@ async def test_connection(conn_id: int):
         "password": decrypt(existing.password_encrypted),
     }
     try:
-        db_tools = DatabaseToolsFactory.create(existing.db_type, db_config)
-        # Actually test the connection by running a query
-        conn = db_tools.get_connection()
-        conn.close()
-        db_info = db_tools.get_db_info()
+        with DatabaseToolsFactory.create(existing.db_type, db_config) as db_tools:
+            # Actually test the connection by running a query
+            conn = db_tools.get_connection()
+            conn.close()
+            db_info = db_tools.get_db_info()
         return ConnectionTestResult(success=True, message="Connection successful", db_info=db_info)
     except Exception as e:
         return ConnectionTestResult(success=False, message=str(e))
@@ -168,8 +168,8 @@ async def list_databases(conn_id: int):
         "password": decrypt(existing.password_encrypted),
     }
     try:
-        db_tools = DatabaseToolsFactory.create(existing.db_type, db_config)
-        result = db_tools.list_databases()
+        with DatabaseToolsFactory.create(existing.db_type, db_config) as db_tools:
+            result = db_tools.list_databases()
         if result.get("status") == "error":
             raise HTTPException(status_code=500, detail=result.get("error", "Unknown error"))
         return DatabaseListResponse(
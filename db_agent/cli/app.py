@@ -1266,8 +1266,8 @@ def setup_wizard(storage: SQLiteStorage) -> bool:
                 'user': username,
                 'password': password
             }
-            test_tools = DatabaseToolsFactory.create(db_type, db_config)
-            test_tools.get_db_info()  # Test connection
+            with DatabaseToolsFactory.create(db_type, db_config) as test_tools:
+                test_tools.get_db_info()  # Test connection
             console.print(f"[green]{SYM_CHECK()}[/] {t('setup_connection_success')}")
         except Exception as e:
             console.print(f"[red]{SYM_CROSS()}[/] {t('setup_connection_failed', error=str(e))}")
@@ -246,8 +246,8 @@ class ConnectionCommandsMixin:
                     'user': username,
                     'password': password
                 }
-                test_tools = DatabaseToolsFactory.create(db_type, db_config)
-                test_tools.get_db_info()  # Test connection
+                with DatabaseToolsFactory.create(db_type, db_config) as test_tools:
+                    test_tools.get_db_info()  # Test connection
                 console.print(f"[green]{SYM_CHECK()}[/] {t('setup_connection_success')}")
             except Exception as e:
                 console.print(f"[red]{SYM_CROSS()}[/] {t('setup_connection_failed', error=str(e))}")
@@ -373,8 +373,8 @@ class ConnectionCommandsMixin:
 
         with console.status(f"[dim]{t('loading')}[/]", spinner="dots"):
             try:
-                db_tools = DatabaseToolsFactory.create(active_conn.db_type, db_config)
-                result = db_tools.list_databases()
+                with DatabaseToolsFactory.create(active_conn.db_type, db_config) as db_tools:
+                    result = db_tools.list_databases()
             except Exception as e:
                 console.print(f"[red]{t('error')}:[/] {e}")
                 return
@@ -500,8 +500,8 @@ class ConnectionCommandsMixin:
                     'user': conn.username,
                     'password': password
                 }
-                test_tools = DatabaseToolsFactory.create(conn.db_type, db_config)
-                info = test_tools.get_db_info()
+                with DatabaseToolsFactory.create(conn.db_type, db_config) as test_tools:
+                    info = test_tools.get_db_info()
                 console.print(f"[green]{SYM_CHECK()}[/] {t('connection_test_success', name=name)}")
                 console.print(f"[dim]  {info.get('type', '')} {info.get('version', '')}[/]")
             except Exception as e:
@@ -127,8 +127,10 @@ class SQLTuningAgent:
         db_type = db_config.pop("type", "postgresql")
         self.db_type = db_type
 
-        # 重新创建数据库工具
+        # 重新创建数据库工具，并释放旧工具持有的连接
+        old_tools = self.db_tools
         self.db_tools = DatabaseToolsFactory.create(db_type, db_config)
+        old_tools.close()
         self.db_info = self.db_tools.get_db_info()
 
         # 同步迁移处理器
@@ -292,7 +294,7 @@ class SQLTuningAgent:
                 # 分析类查询性能检查
                 perf_check = self.db_tools.check_query_performance(sql)
 
-                if perf_check.get("should_confirm"):
+                if perf_check.should_confirm:
                     # 发现性能问题，加入待确认队列
                     self.pending_operations.append({
                         "type": "execute_safe_query",
@@ -302,8 +304,8 @@ class SQLTuningAgent:
                     result = {
                         "status": "pending_performance_confirmation",
                         "sql": sql,
-                        "performance_summary": perf_check.get("performance_summary"),
-                        "issues": perf_check.get("issues"),
+                        "performance_summary": perf_check.performance_summary,
+                        "issues": list(perf_check.issues),
                         "message": t("db_performance_issue_need_confirm")
                     }
                 else:
@@ -540,12 +542,12 @@ class SQLTuningAgent:
                 result.append({"type": op["type"], "sql": sql})
             elif op["type"] == "execute_safe_query":
                 sql = op["input"].get("sql", "")
-                perf_check = op.get("performance_check", {})
+                perf_check = op.get("performance_check")
                 result.append({
                     "type": op["type"],
                     "sql": sql,
-                    "performance_issues": perf_check.get("issues", []),
-                    "performance_summary": perf_check.get("performance_summary", {})
+                    "performance_issues": list(perf_check.issues) if perf_check else [],
+                    "performance_summary": perf_check.performance_summary if perf_check else {}
                 })
             else:
                 sql = ""
@@ -1,7 +1,10 @@
 """
 Database Tools Module - Multi-database support layer
 """
-from .base import BaseDatabaseTools
+from .base import (
+    BaseDatabaseTools, PerfCheckResult, ListTablesResult, DescribeTableResult,
+    SampleDataResult, QueryResult, ExplainResult
+)
 from .factory import DatabaseToolsFactory
 from .postgresql import PostgreSQLTools
 from .mysql import MySQLTools
@@ -10,6 +13,12 @@ from .sqlserver import SQLServerTools
 
 __all__ = [
     'BaseDatabaseTools',
+    'PerfCheckResult',
+    'ListTablesResult',
+    'DescribeTableResult',
+    'SampleDataResult',
+    'QueryResult',
+    'ExplainResult',
     'DatabaseToolsFactory',
     'PostgreSQLTools',
     'MySQLTools',
@@ -1,26 +1,190 @@
 """
 Database Tools Base Class - Abstract interface for database operations
 """
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
-from db_agent.core.sql_analyzer import SQLAnalyzer
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple, TypedDict
+from db_agent.core.sql_analyzer import SQLAnalyzer, normalize_sql
+from .ddl_cache import get_ddl_cache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL type OID of json, the column type of EXPLAIN (FORMAT JSON)
+JSON_TYPE_OID = 114
+
+_PERF_CACHE_SIZE = 256
+
+# Single-table equality lookups (SELECT ... FROM t WHERE col = ... [LIMIT n])
+# never need a performance check. Parentheses are excluded, which rules out
+# subqueries, aggregates and window functions; the exclusion regex rejects
+# the remaining analytical keywords.
+_POINT_LOOKUP_RE = re.compile(
+    r"\s*SELECT\s[^();]*?\bFROM\s+[\w.]+\s+WHERE\s+[\w.]+\s*=\s*[^();]+?(?:\s+LIMIT\s+\d+)?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL
+)
+_POINT_LOOKUP_EXCLUDE_RE = re.compile(
+    r"\b(?:JOIN|GROUP|ORDER|UNION|INTERSECT|EXCEPT|DISTINCT)\b",
+    re.IGNORECASE
+)
+
+# Function-call SELECTs without FROM, see _check_function_call_in_select
+_FUNC_CALL_SELECT_RE = re.compile(r"SELECT\s+\w+\s*\(", re.IGNORECASE)
+_FROM_KEYWORD_RE = re.compile(r"\bFROM\b", re.IGNORECASE)
+
+
+
+# Result shapes of the most frequently called tool methods. Keys beyond
+# "status" depend on success or failure, hence total=False.
+
+class ListTablesResult(TypedDict, total=False):
+    status: str
+    schema: str
+    count: int
+    tables: List[Dict[str, Any]]
+    error: str
+
+
+class DescribeTableResult(TypedDict, total=False):
+    status: str
+    table: str
+    columns: List[Dict[str, Any]]
+    primary_key: List[str]
+    foreign_keys: List[Dict[str, Any]]
+    error: str
+
+
+class SampleDataResult(TypedDict, total=False):
+    status: str
+    table: str
+    columns: List[str]
+    count: int
+    rows: List[Dict[str, Any]]
+    truncated: bool
+    error: str
+
+
+class QueryResult(TypedDict, total=False):
+    status: str
+    count: int
+    rows: List[Dict[str, Any]]
+    error: str
+
+
+class ExplainResult(TypedDict, total=False):
+    status: str
+    explain_output: Any
+    plan: List[Any]
+    analyzed: bool
+    sql: str
+    error: str
+
+
+@dataclass(frozen=True)
+class PerfCheckResult:
+    """Result of BaseDatabaseTools.check_query_performance"""
+    __slots__ = ("should_confirm", "is_analytical", "performance_summary", "issues")
+
+    should_confirm: bool
+    is_analytical: bool
+    performance_summary: Mapping[str, Any]
+    issues: Tuple[Dict[str, Any], ...]
+
+
+# Shared read-only result for the common non-analytical case
+_NON_ANALYTICAL_RESULT = PerfCheckResult(False, False, MappingProxyType({}), ())
+
+
+def _parse_explain_json(value: Any) -> Any:
+    """Decode EXPLAIN (FORMAT JSON) text, using orjson when it is installed.
+    Values the driver has already decoded are returned unchanged."""
+    if isinstance(value, (str, bytes, bytearray)):
+        return orjson.loads(value) if ORJSON_AVAILABLE else json.loads(value)
+    return value
 
 
-class BaseDatabaseTools(ABC):
-    """Abstract base class for database tools"""
+@lru_cache(maxsize=8)
+def _analyzer_for(db_type: str) -> SQLAnalyzer:
+    """Return the shared SQL analyzer for a database type.
+    SQLAnalyzer holds no per-connection state, so one instance per type is
+    shared by every tools object."""
+    return SQLAnalyzer(db_type)
+
+
+@lru_cache(maxsize=512)
+def _is_function_call_select(sql: str) -> bool:
+    """True for a SELECT without FROM that calls a function. Cached because
+    agents and dashboards tend to re-issue the same statements."""
+    return (sql[:6].upper() == "SELECT"
+            and not _FROM_KEYWORD_RE.search(sql)
+            and _FUNC_CALL_SELECT_RE.search(sql) is not None)
+
+
+class BaseDatabaseTools:
+    """Base class for database tools
+
+    State lives in __slots__. Every backend declares the attributes it adds,
+    so tools instances carry no per-instance __dict__; a new attribute must
+    be listed in its class's __slots__.
+    """
+
+    __slots__ = ("_perf_cache", "_perf_cache_lock", "_schema_generation")
+
+    # Resolved per subclass in __init_subclass__ when db_type is a constant
+    _analyzer: Optional[SQLAnalyzer] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        db_type_prop = cls.__dict__.get("db_type")
+        if isinstance(db_type_prop, property):
+            try:
+                cls._analyzer = _analyzer_for(db_type_prop.fget(None))
+            except Exception:
+                # db_type depends on instance state; resolve lazily instead
+                cls._analyzer = None
 
     def __init__(self):
         """Initialize base database tools"""
-        # SQL analyzer will be initialized by subclasses after db_type is set
-        self._sql_analyzer = None
+        # (schema generation, query signature) -> check_query_performance result
+        self._perf_cache = OrderedDict()
+        self._perf_cache_lock = threading.Lock()
+        self._schema_generation = 0
 
     def _get_sql_analyzer(self) -> SQLAnalyzer:
-        """Get SQL analyzer instance (lazy initialization)"""
-        if self._sql_analyzer is None:
-            self._sql_analyzer = SQLAnalyzer(self.db_type)
-        return self._sql_analyzer
+        """Get the SQL analyzer shared by all tools of this database type"""
+        analyzer = type(self)._analyzer
+        if analyzer is None:
+            analyzer = _analyzer_for(self.db_type)
+        return analyzer
+
+    def close(self):
+        """Release connections held by the tools. The default holds none."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
-    def check_query_performance(self, sql: str) -> Dict[str, Any]:
+    def _invalidate_perf_cache(self):
+        """Drop cached performance checks after indexes or statistics change"""
+        with self._perf_cache_lock:
+            self._schema_generation += 1
+            self._perf_cache.clear()
+
+    def check_query_performance(self, sql: str) -> PerfCheckResult:
         """
         检查查询性能，返回是否需要确认
 
@@ -28,143 +192,163 @@ class BaseDatabaseTools(ABC):
             sql: SQL语句
 
         Returns:
-            性能检查结果，包含:
+            性能检查结果 PerfCheckResult，包含:
             - should_confirm: 是否需要用户确认
             - is_analytical: 是否为分析类查询
             - performance_summary: 性能摘要
             - issues: 问题列表
         """
+        # 点查快速路径：无需分析器与EXPLAIN
+        if _POINT_LOOKUP_RE.match(sql) and not _POINT_LOOKUP_EXCLUDE_RE.search(sql):
+            return _NON_ANALYTICAL_RESULT
+
+        signature = normalize_sql(sql)
+        with self._perf_cache_lock:
+            cache_key = (self._schema_generation, signature)
+            cached = self._perf_cache.get(cache_key)
+            if cached is not None:
+                self._perf_cache.move_to_end(cache_key)
+                return cached
+
         analyzer = self._get_sql_analyzer()
 
-        # 检查是否为分析类查询
+        # 检查是否为分析类查询，非分析类查询无需EXPLAIN
         if not analyzer.is_analytical_query(sql):
-            return {
-                "should_confirm": False,
-                "is_analytical": False,
-                "performance_summary": {},
-                "issues": []
-            }
+            return _NON_ANALYTICAL_RESULT
 
-        # 执行EXPLAIN获取执行计划
+        # 获取执行计划
         try:
             explain_result = self.run_explain(sql, analyze=False)
         except Exception as e:
             # EXPLAIN失败时不阻止执行
-            return {
-                "should_confirm": False,
-                "is_analytical": True,
-                "performance_summary": {"error": str(e)},
-                "issues": []
-            }
+            return PerfCheckResult(False, True, {"error": str(e)}, ())
 
         # 解析执行计划
         analysis = analyzer.parse_explain_output(explain_result)
 
-        return {
-            "should_confirm": analysis.get("should_confirm", False),
-            "is_analytical": True,
-            "performance_summary": analysis.get("performance_summary", {}),
-            "issues": analysis.get("issues", [])
-        }
+        result = PerfCheckResult(
+            analysis.get("should_confirm", False),
+            True,
+            analysis.get("performance_summary", {}),
+            tuple(analysis.get("issues", ()))
+        )
+
+        # 仅缓存成功解析的结果，EXPLAIN失败时下次重试
+        if explain_result.get("status") == "success":
+            with self._perf_cache_lock:
+                # Skip results planned before a concurrent invalidation
+                if cache_key[0] == self._schema_generation:
+                    self._perf_cache[cache_key] = result
+                    if len(self._perf_cache) > _PERF_CACHE_SIZE:
+                        self._perf_cache.popitem(last=False)
+        return result
 
-    @abstractmethod
     def get_connection(self):
         """Get database connection"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_db_info(self) -> Dict[str, Any]:
         """Get database information"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def list_tables(self, schema: str = None) -> Dict[str, Any]:
+    def list_tables(self, schema: str = None) -> ListTablesResult:
         """List all tables in the database"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def describe_table(self, table_name: str, schema: str = None) -> Dict[str, Any]:
+    def describe_table(self, table_name: str, schema: str = None) -> DescribeTableResult:
         """Get table structure information"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def execute_sql(self, sql: str, confirmed: bool = False) -> Dict[str, Any]:
         """Execute any SQL statement (INSERT/UPDATE/DELETE/CREATE/ALTER/DROP etc.)"""
-        pass
+        raise NotImplementedError
 
     @staticmethod
-    def _check_function_call_in_select(sql_upper: str) -> Optional[Dict[str, Any]]:
+    def _check_function_call_in_select(sql: str) -> Optional[Dict[str, Any]]:
         """Detect SELECT that calls functions/stored procedures without FROM.
         These may modify data and should go through execute_sql with confirmation.
+        Matching is case-insensitive, so callers may pass the SQL as-is.
         Returns an error dict if detected, None otherwise."""
-        import re
-        if sql_upper.startswith("SELECT") and not re.search(r'\bFROM\b', sql_upper):
-            if re.search(r'SELECT\s+\w+\s*\(', sql_upper):
-                return {
-                    "status": "error",
-                    "error": "This SELECT calls a function/stored procedure that may modify data. Please use execute_sql instead so the user can review and confirm."
-                }
+        if _is_function_call_select(sql):
+            return {
+                "status": "error",
+                "error": "This SELECT calls a function/stored procedure that may modify data. Please use execute_sql instead so the user can review and confirm."
+            }
         return None
 
-    @abstractmethod
-    def execute_safe_query(self, sql: str) -> Dict[str, Any]:
+    @staticmethod
+    def _rows_to_dicts(cur) -> List[Dict[str, Any]]:
+        """Convert the rows of an executed cursor into a list of dicts.
+        Column names are read from cur.description once, and rows are consumed
+        straight from the cursor iterator instead of an extra fetchall() list."""
+        if cur.description is None:
+            return []
+        columns = tuple(desc[0] for desc in cur.description)
+        return [dict(zip(columns, row)) for row in cur]
+
+    def execute_safe_query(self, sql: str) -> QueryResult:
         """Execute safe read-only SELECT query"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def run_explain(self, sql: str, analyze: bool = False) -> Dict[str, Any]:
+    def run_explain(self, sql: str, analyze: bool = False) -> ExplainResult:
         """Run EXPLAIN to analyze SQL execution plan"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def identify_slow_queries(self, min_duration_ms: float = 1000, limit: int = 20) -> Dict[str, Any]:
         """Identify slow queries in the database"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_running_queries(self) -> Dict[str, Any]:
         """Get currently running queries"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def check_index_usage(self, table_name: str, schema: str = None) -> Dict[str, Any]:
         """Check index usage for a table"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_table_stats(self, table_name: str, schema: str = None) -> Dict[str, Any]:
         """Get table statistics"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def create_index(self, index_sql: str, concurrent: bool = True) -> Dict[str, Any]:
         """Create an index"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def analyze_table(self, table_name: str, schema: str = None) -> Dict[str, Any]:
         """Update table statistics (ANALYZE)"""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def get_sample_data(self, table_name: str, schema: str = None, limit: int = 10) -> Dict[str, Any]:
+    def get_sample_data(self, table_name: str, schema: str = None, limit: int = 10) -> SampleDataResult:
         """Get sample data from a table"""
-        pass
+        raise NotImplementedError
+
+    def iter_sample_data(self, table_name: str, schema: str = None, limit: int = 10,
+                         batch: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over sample rows of a table.
+
+        The default implementation materializes get_sample_data; backends
+        with server-side cursors override it to fetch `batch` rows at a time.
+
+        Raises:
+            RuntimeError: If the rows cannot be retrieved
+        """
+        result = self.get_sample_data(table_name, schema, limit)
+        if result.get("status") != "success":
+            raise RuntimeError(result.get("error", "Failed to get sample data"))
+        yield from result.get("rows", [])
 
-    @abstractmethod
     def list_databases(self) -> Dict[str, Any]:
         """List all databases on the current server instance"""
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def db_type(self) -> str:
         """Return the database type identifier (e.g., 'postgresql', 'mysql')"""
-        pass
+        raise NotImplementedError
 
     # ==================== Migration Support Methods ====================
 
-    @abstractmethod
     def get_all_objects(self, schema: str = None, object_types: List[str] = None) -> Dict[str, Any]:
         """
         Get all database objects.
@@ -187,9 +371,8 @@ class BaseDatabaseTools(ABC):
                 "constraints": [{"name": str, "table": str, "type": str, ...}]
             }
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_object_ddl(self, object_type: str, object_name: str, schema: str = None) -> Dict[str, Any]:
         """
         Get the DDL statement for a database object.
@@ -209,9 +392,65 @@ class BaseDatabaseTools(ABC):
                 "dependencies": [{"type": str, "name": str}]
             }
         """
-        pass
+        raise NotImplementedError
+
+    def _ddl_version_token(self, object_type: str, object_name: str, schema: str) -> Optional[str]:
+        """
+        Return a token that changes whenever the object's DDL may have changed.
+
+        Backends that can derive one cheaply from their catalog override this;
+        returning None disables DDL caching for the object.
+        """
+        return None
+
+    @contextmanager
+    def metadata_session(self):
+        """
+        Scope in which metadata calls made on this thread may share one
+        connection. The default does nothing; backends that support it open
+        the connection on entry and close it on exit.
+        """
+        yield
+
+    def get_object_ddl_cached(self, object_type: str, object_name: str, schema: str = None) -> Dict[str, Any]:
+        """
+        get_object_ddl backed by the on-disk DDL cache.
+
+        Falls through to get_object_ddl when the backend has no version token
+        for the object; only successful results are cached. The token and
+        the DDL are read within one metadata_session.
+        """
+        with self.metadata_session():
+            try:
+                token = self._ddl_version_token(object_type, object_name, schema)
+            except Exception as e:
+                logger.debug(f"DDL version token unavailable: {e}")
+                token = None
+            if token is None:
+                return self.get_object_ddl(object_type, object_name, schema)
+
+            # The user is part of the key: what the catalog shows depends on privileges
+            config = getattr(self, "db_config", {})
+            fingerprint = (f"{self.db_type}://{config.get('user')}@{config.get('host')}:"
+                           f"{config.get('port')}/{config.get('database')}")
+            key = (fingerprint, object_type, schema or "", object_name)
+
+            try:
+                cache = get_ddl_cache()
+            except Exception as e:
+                # An unwritable cache location must not break DDL retrieval
+                logger.warning(f"DDL cache unavailable: {e}")
+                return self.get_object_ddl(object_type, object_name, schema)
+
+            cached = cache.get(key, token)
+            if cached is not None:
+                return cached
+
+            result = self.get_object_ddl(object_type, object_name, schema)
+            if result.get("status") == "success":
+                cache.put(key, token, result)
+            return result
 
-    @abstractmethod
     def get_object_dependencies(self, schema: str = None) -> Dict[str, Any]:
         """
         Get object dependencies in the database.
@@ -235,9 +474,8 @@ class BaseDatabaseTools(ABC):
                 }
             }
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_foreign_key_dependencies(self, schema: str = None) -> Dict[str, Any]:
         """
         Get foreign key dependencies between tables.
@@ -260,4 +498,36 @@ class BaseDatabaseTools(ABC):
                 "table_order": ["table1", "table2", ...]  # Topologically sorted
             }
         """
-        pass
+        raise NotImplementedError
+
+    def get_migration_snapshot(self, schema: str = None, object_types: List[str] = None) -> Dict[str, Any]:
+        """
+        Get everything a migration analysis needs from the source database.
+
+        The default implementation simply calls get_all_objects,
+        get_foreign_key_dependencies and get_object_dependencies in turn;
+        backends may override it to share one connection or query.
+
+        Args:
+            schema: Schema name (optional)
+            object_types: List of object types to include (optional)
+
+        Returns:
+            {
+                "status": "success",
+                "objects": <get_all_objects result>,
+                "foreign_keys": <get_foreign_key_dependencies result>,
+                "dependencies": <get_object_dependencies result>
+            }
+            or the get_all_objects error result if that call fails.
+        """
+        objects_result = self.get_all_objects(schema=schema, object_types=object_types)
+        if objects_result.get("status") == "error":
+            return objects_result
+
+        return {
+            "status": "success",
+            "objects": objects_result,
+            "foreign_keys": self.get_foreign_key_dependencies(schema=schema),
+            "dependencies": self.get_object_dependencies(schema=schema)
+        }
@@ -0,0 +1,94 @@
+"""
+DDL Cache - On-disk cache for get_object_ddl results
+
+Entries are keyed by (database fingerprint, object type, schema, object name)
+and carry a version token computed from the source catalog. A lookup only
+hits when the stored token matches the current one, so any DDL change on the
+server invalidates the entry without explicit bookkeeping.
+"""
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+DDLCacheKey = Tuple[str, str, str, str]
+
+
+class DDLCache:
+    """SQLite-backed DDL cache shared by all database tools in the process"""
+
+    DEFAULT_DB_PATH = os.path.join(str(Path.home()), '.db-agent', 'ddl_cache.db')
+
+    def __init__(self, db_path: str = None):
+        """
+        Initialize DDL cache.
+
+        Args:
+            db_path: Path to SQLite database file. Defaults to ~/.db-agent/ddl_cache.db
+        """
+        self.db_path = db_path or self.DEFAULT_DB_PATH
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, mode=0o700)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS ddl_cache (
+                    fingerprint TEXT NOT NULL,
+                    object_type TEXT NOT NULL,
+                    schema_name TEXT NOT NULL,
+                    object_name TEXT NOT NULL,
+                    version_token TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    fetched_at TEXT NOT NULL,
+                    PRIMARY KEY (fingerprint, object_type, schema_name, object_name)
+                )
+            ''')
+            self._conn.commit()
+
+    def get(self, key: DDLCacheKey, version_token: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key if it was stored under version_token"""
+        with self._lock:
+            row = self._conn.execute('''
+                SELECT result FROM ddl_cache
+                WHERE fingerprint = ? AND object_type = ? AND schema_name = ? AND object_name = ?
+                  AND version_token = ?
+            ''', (*key, version_token)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: DDLCacheKey, version_token: str, result: Dict[str, Any]):
+        """Store a get_object_ddl result under key and version_token"""
+        payload = json.dumps(result, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO ddl_cache
+                    (fingerprint, object_type, schema_name, object_name, version_token, result, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (*key, version_token, payload, datetime.now().isoformat()))
+            self._conn.commit()
+
+    def invalidate(self, fingerprint: str):
+        """Drop every cached entry for one database"""
+        with self._lock:
+            self._conn.execute('DELETE FROM ddl_cache WHERE fingerprint = ?', (fingerprint,))
+            self._conn.commit()
+
+
+_shared_cache: Optional[DDLCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_ddl_cache() -> DDLCache:
+    """Return the process-wide DDL cache, creating it on first use"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = DDLCache()
+    return _shared_cache
@@ -1,14 +1,48 @@
 """
 Database Tools Factory - Creates appropriate database tools based on type
 """
-from typing import Dict, Any
+import sys
+from importlib import import_module
+from typing import Dict, Any, Type
 from .base import BaseDatabaseTools
 
+# Database type -> (module, class name); modules are imported on first use.
+# Keys are interned so lookups with interned type strings compare by identity.
+_LOADERS = {
+    sys.intern("postgresql"): (".postgresql", "PostgreSQLTools"),
+    sys.intern("mysql"): (".mysql", "MySQLTools"),
+    sys.intern("gaussdb"): (".gaussdb", "GaussDBTools"),
+    sys.intern("oracle"): (".oracle", "OracleTools"),
+    sys.intern("sqlserver"): (".sqlserver", "SQLServerTools"),
+}
+
+# Database type -> tools class, filled as each backend is first requested
+_CLASS_CACHE: Dict[str, Type[BaseDatabaseTools]] = {}
+
+
+def _load_class(db_type: str) -> Type[BaseDatabaseTools]:
+    """Import and cache the tools class for a database type"""
+    module_name, class_name = _LOADERS[db_type]
+    cls = getattr(import_module(module_name, __package__), class_name)
+    _CLASS_CACHE[db_type] = cls
+    return cls
+
+
+# Resolve the most common backends while the package itself is being imported,
+# so concurrent first calls to create() find them in the cache instead of
+# contending for the import lock. A missing driver just defers to first use.
+for _db_type in ("postgresql", "mysql"):
+    try:
+        _load_class(_db_type)
+    except ImportError:
+        pass
+del _db_type
+
 
 class DatabaseToolsFactory:
     """Factory class for creating database-specific tools"""
 
-    SUPPORTED_TYPES = ["postgresql", "mysql", "gaussdb", "oracle", "sqlserver"]
+    SUPPORTED_TYPES = list(_LOADERS)
 
     @staticmethod
     def create(db_type: str, db_config: Dict[str, Any]) -> BaseDatabaseTools:
@@ -25,28 +59,20 @@ class DatabaseToolsFactory:
         Raises:
             ValueError: If database type is not supported
         """
-        db_type = db_type.lower()
-
-        if db_type == "postgresql":
-            from .postgresql import PostgreSQLTools
-            return PostgreSQLTools(db_config)
-        elif db_type == "mysql":
-            from .mysql import MySQLTools
-            return MySQLTools(db_config)
-        elif db_type == "gaussdb":
-            from .gaussdb import GaussDBTools
-            return GaussDBTools(db_config)
-        elif db_type == "oracle":
-            from .oracle import OracleTools
-            return OracleTools(db_config)
-        elif db_type == "sqlserver":
-            from .sqlserver import SQLServerTools
-            return SQLServerTools(db_config)
-        else:
-            raise ValueError(
-                f"Unsupported database type: {db_type}. "
-                f"Supported types: {', '.join(DatabaseToolsFactory.SUPPORTED_TYPES)}"
-            )
+        # Config values are normally lowercase already; skip the copy then
+        if not db_type.islower():
+            db_type = db_type.lower()
+
+        cls = _CLASS_CACHE.get(db_type)
+        if cls is None:
+            try:
+                cls = _load_class(db_type)
+            except KeyError:
+                raise ValueError(
+                    f"Unsupported database type: {db_type}. "
+                    f"Supported types: {', '.join(DatabaseToolsFactory.SUPPORTED_TYPES)}"
+                ) from None
+        return cls(db_config)
 
     @staticmethod
     def get_supported_types():
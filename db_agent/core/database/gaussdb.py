@@ -4,18 +4,366 @@ GaussDB database tools using pg8000 driver (supports sha256 authentication on Wi
 """
 import pg8000
 import pg8000.native
-from typing import Dict, Any, List
+import functools
+import inspect
+import queue
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, List, Tuple
 import logging
 import re
 from db_agent.i18n import t
-from .base import BaseDatabaseTools
+from .base import (
+    BaseDatabaseTools, JSON_TYPE_OID, _parse_explain_json,
+    DescribeTableResult, ExplainResult, ListTablesResult, QueryResult, SampleDataResult
+)
 
 logger = logging.getLogger(__name__)
 
+# application_name reported by our sessions, so DBAs can tell them apart
+_APPLICATION_NAME = "db_agent_gaussdb"
+
+# Idle connections kept per GaussDBTools instance
+_POOL_SIZE = 5
+# Upper bound on concurrent lookups issued by describe_tables; matching the
+# pool size lets every worker reuse an idle connection
+_DESCRIBE_MAX_WORKERS = _POOL_SIZE
+# Connections idle longer than this are pinged before being handed out
+_POOL_IDLE_CHECK_SECONDS = 30.0
+# Server-side prepared statements kept per pooled connection; the least
+# recently used one is closed when a new statement would exceed this
+_PREPARED_PER_CONN = 64
+
+# Query text previews in activity views are cut client-side to these lengths
+_QUERY_PREVIEW_LEN = 500
+_THREAD_QUERY_PREVIEW_LEN = 200
+
+# Upper bound on rows returned by execute_safe_query / execute_sql
+MAX_ROWS = 10000
+
+# Catalog lookups (list_tables, describe_table, check_index_usage) are
+# reused for this long; any DDL through this instance clears them sooner
+_META_CACHE_TTL = 60.0
+_META_CACHE_SIZE = 256
+# Lock / thread-wait snapshots are shared between callers polling within this window
+_MONITOR_CACHE_TTL = 1.0
+
+# (host, port, database, user) -> (fetched_at, version, version_num, version_full, is_distributed)
+_DB_INFO_CACHE: Dict[tuple, tuple] = {}
+_DB_INFO_LOCK = threading.Lock()
+_DB_INFO_TTL = 300.0
+
+# Leading-keyword checks; match() only looks at the start of the statement
+_SAFE_QUERY_RE = re.compile(r'\s*(?:SELECT|SHOW|EXPLAIN|WITH)\b', re.IGNORECASE)
+_READONLY_SQL_RE = re.compile(r'\s*(?:SELECT|SHOW|EXPLAIN)\b', re.IGNORECASE)
+_AUTOCOMMIT_SQL_RE = re.compile(r'\s*(?:CREATE\s+DATABASE|DROP\s+DATABASE|VACUUM)\b', re.IGNORECASE)
+# group(1) is set when the statement already says CONCURRENTLY
+_CREATE_INDEX_RE = re.compile(r'\s*CREATE\s+INDEX(\s+CONCURRENTLY)?\b', re.IGNORECASE)
+# " AS " anywhere, used to spot a select list missing its SELECT keyword
+_AS_KEYWORD_RE = re.compile(r' AS ', re.IGNORECASE)
+
+# EXPLAIN prefixes for run_explain: text output when the plan is executed,
+# JSON (parsed by SQLAnalyzer) otherwise
+_EXPLAIN_ANALYZE_PREFIX = "EXPLAIN ANALYZE "
+_EXPLAIN_JSON_PREFIX = "EXPLAIN (FORMAT JSON) "
+
+# Version number in "GaussDB Kernel V500R002C10" or "(GaussDB 8.1.3)" form
+_VERSION_RE = re.compile(r'V(\d+)R(\d+)C(\d+)|(\d+)\.(\d+)\.(\d+)')
+
+
+_RUNNING_QUERIES_CENTRALIZED_SQL = """
+    SELECT
+        pid,
+        usename,
+        datname,
+        application_name,
+        client_addr,
+        state,
+        waiting,
+        query_start,
+        now() - query_start AS duration,
+        query_id,
+        query
+    FROM pg_stat_activity
+    WHERE state = 'active'
+      AND pid != pg_backend_pid()
+    ORDER BY query_start
+    LIMIT :limit
+"""
+
+_RUNNING_QUERIES_DISTRIBUTED_SQL = """
+    SELECT
+        coorname,
+        pid,
+        usename,
+        datname,
+        application_name,
+        client_addr,
+        state,
+        waiting,
+        query_start,
+        now() - query_start AS duration,
+        query_id,
+        query
+    FROM pgxc_stat_activity
+    WHERE state = 'active'
+      AND NOT (coorname = pgxc_node_str() AND pid = pg_backend_pid())
+    ORDER BY query_start
+    LIMIT :limit
+"""
+
+_SLOW_QUERIES_CENTRALIZED_SQL = """
+    SELECT
+        pid,
+        usename,
+        datname,
+        state,
+        query_start,
+        EXTRACT(EPOCH FROM (now() - query_start)) * 1000 AS duration_ms,
+        query_id,
+        query
+    FROM pg_stat_activity
+    WHERE state = 'active'
+      AND query_start < now() - :min_duration_ms * interval '1 millisecond'
+      AND pid != pg_backend_pid()
+    ORDER BY query_start
+    LIMIT :limit
+"""
+
+_SLOW_QUERIES_DISTRIBUTED_SQL = """
+    SELECT
+        coorname,
+        pid,
+        usename,
+        datname,
+        state,
+        query_start,
+        EXTRACT(EPOCH FROM (now() - query_start)) * 1000 AS duration_ms,
+        query_id,
+        query
+    FROM pgxc_stat_activity
+    WHERE state = 'active'
+      AND query_start < now() - :min_duration_ms * interval '1 millisecond'
+    ORDER BY query_start
+    LIMIT :limit
+"""
+
+_TABLE_STATS_SQL = """
+    SELECT
+        schemaname,
+        relname as tablename,
+        pg_size_pretty(pg_total_relation_size(schemaname||'.'||relname)) as total_size,
+        pg_size_pretty(pg_relation_size(schemaname||'.'||relname)) as table_size,
+        pg_size_pretty(pg_indexes_size(schemaname||'.'||relname)) as indexes_size,
+        n_live_tup,
+        n_dead_tup,
+        ROUND(100.0 * n_dead_tup / NULLIF(n_live_tup + n_dead_tup, 0), 2) as dead_ratio,
+        last_vacuum,
+        last_autovacuum,
+        last_analyze,
+        last_autoanalyze,
+        seq_scan,
+        seq_tup_read,
+        idx_scan,
+        idx_tup_fetch
+    FROM pg_stat_user_tables
+    WHERE schemaname = :schema AND relname = :table_name;
+"""
+
+_THREAD_WAIT_STATUS_CENTRALIZED_SQL = """
+    SELECT
+        db_name,
+        thread_name,
+        query_id,
+        tid,
+        lwtid,
+        ptid,
+        tlevel,
+        smpid,
+        wait_status,
+        wait_event,
+        query
+    FROM pg_thread_wait_status
+    WHERE wait_status != 'wait cmd'
+    ORDER BY wait_status
+    LIMIT :limit;
+"""
+
+_THREAD_WAIT_STATUS_DISTRIBUTED_SQL = """
+    SELECT
+        node_name,
+        db_name,
+        thread_name,
+        query_id,
+        tid,
+        lwtid,
+        ptid,
+        tlevel,
+        smpid,
+        wait_status,
+        wait_event,
+        query
+    FROM pgxc_thread_wait_status
+    WHERE wait_status != 'wait cmd'
+    ORDER BY wait_status
+    LIMIT :limit;
+"""
+
+# Ungranted locks with the waiting session's user and query
+_LOCKS_INFO_CENTRALIZED_SQL = """
+    SELECT
+        l.locktype,
+        l.database,
+        l.relation,
+        l.virtualxid,
+        l.transactionid,
+        l.virtualtransaction,
+        l.pid,
+        l.mode,
+        l.granted,
+        a.usename,
+        a.application_name,
+        a.query
+    FROM pg_locks l
+    LEFT JOIN pg_stat_activity a ON a.pid = l.pid
+    WHERE NOT l.granted
+    LIMIT :limit;
+"""
+
+# pids are only unique within a node, so cluster-wide lock rows are not
+# joined to pgxc_stat_activity: a pid-only join could pair a lock with
+# another node's session or duplicate it
+_LOCKS_INFO_DISTRIBUTED_SQL = """
+    SELECT
+        locktype,
+        database,
+        relation,
+        virtualxid,
+        transactionid,
+        virtualtransaction,
+        pid,
+        mode,
+        granted
+    FROM pgxc_locks
+    WHERE NOT granted
+    LIMIT :limit;
+"""
+
+# Mode-specific catalog queries, picked once per instance after mode detection
+_QUERIES_BY_MODE = {
+    False: {
+        "running_queries": _RUNNING_QUERIES_CENTRALIZED_SQL,
+        "slow_queries": _SLOW_QUERIES_CENTRALIZED_SQL,
+        "table_stats": _TABLE_STATS_SQL,
+        "thread_wait_status": _THREAD_WAIT_STATUS_CENTRALIZED_SQL,
+        "locks_info": _LOCKS_INFO_CENTRALIZED_SQL,
+    },
+    True: {
+        "running_queries": _RUNNING_QUERIES_DISTRIBUTED_SQL,
+        "slow_queries": _SLOW_QUERIES_DISTRIBUTED_SQL,
+        "table_stats": _TABLE_STATS_SQL,
+        "thread_wait_status": _THREAD_WAIT_STATUS_DISTRIBUTED_SQL,
+        "locks_info": _LOCKS_INFO_DISTRIBUTED_SQL,
+    },
+}
+
+
+def _parse_version(version_full: str) -> Tuple[str, int]:
+    """Parse "GaussDB Kernel V500R002C10" or "(GaussDB 8.1.3)" into
+    ("500.002.10", 5000210); ("unknown", 0) when no version is found"""
+    match = _VERSION_RE.search(version_full)
+    if match is None:
+        return "unknown", 0
+    # Exactly one alternative matched, and all of its groups are digit runs
+    major, minor, patch = match.group(1, 2, 3) if match.group(1) else match.group(4, 5, 6)
+    return f"{major}.{minor}.{patch}", int(major) * 10000 + int(minor) * 100 + int(patch)
+
+
+def _drain_pool(pool: "queue.Queue") -> None:
+    """Close every idle connection in pool
+
+    Module-level so the finalizer registered in GaussDBTools.__init__ does
+    not keep the instance alive.
+    """
+    while True:
+        try:
+            conn, _ = pool.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _qualified_name(schema: str, name: str) -> str:
+    """Quote a schema-qualified object name for safe interpolation into SQL"""
+    return f"{pg8000.native.identifier(schema)}.{pg8000.native.identifier(name)}"
+
+
+def _result_cached(ttl: float):
+    """Serve successful results of a read-only lookup from the instance's
+    result cache for ttl seconds, keyed by method name and bound arguments.
+
+    Concurrent misses on the same key are collapsed: one caller runs the
+    query while the others wait for it and then read the cached result.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (method.__name__,) + tuple(bound.arguments.values())[1:]
+
+            cached = self._cache_lookup(key, ttl)
+            if cached is not None:
+                return cached
+
+            with self._meta_lock:
+                key_lock = self._inflight.setdefault(key, threading.Lock())
+            with key_lock:
+                cached = self._cache_lookup(key, ttl)
+                if cached is not None:
+                    return cached
+                try:
+                    result = method(self, *args, **kwargs)
+                    if result.get("status") == "success":
+                        with self._meta_lock:
+                            self._meta_cache[key] = (time.monotonic(), result)
+                            if len(self._meta_cache) > _META_CACHE_SIZE:
+                                self._meta_cache.popitem(last=False)
+                        result = dict(result)
+                finally:
+                    with self._meta_lock:
+                        self._inflight.pop(key, None)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+_metadata_cached = _result_cached(_META_CACHE_TTL)
+_monitoring_cached = _result_cached(_MONITOR_CACHE_TTL)
+
 
 class GaussDBTools(BaseDatabaseTools):
     """GaussDB database tools implementation (Centralized and Distributed modes)"""
 
+    __slots__ = (
+        "db_config", "db_version", "db_version_num", "db_version_full",
+        "_is_distributed", "_pool", "_meta_cache", "_meta_lock", "_inflight",
+        "_prepared", "_prepared_columns", "_queries", "_mode", "_activity_view",
+        "_db_info", "__weakref__"
+    )
+
     def __init__(self, db_config: Dict[str, Any]):
         super().__init__()
         self.db_config = db_config
@@ -23,10 +371,36 @@ class GaussDBTools(BaseDatabaseTools):
         self.db_version_num = None
         self.db_version_full = None
         self._is_distributed = False
+        self._pool = queue.LifoQueue(maxsize=_POOL_SIZE)
+        # pg8000 connections hold reference cycles, so a dropped instance's
+        # pool would otherwise wait for the cyclic GC to close its sessions
+        weakref.finalize(self, _drain_pool, self._pool)
+        # (method, args...) -> (timestamp, result), see _result_cached
+        self._meta_cache = OrderedDict()
+        self._meta_lock = threading.Lock()
+        # (method, args...) -> lock held by the caller currently loading it
+        self._inflight = {}
+        # pooled connection -> {sql: PreparedStatement}, see _run_prepared
+        self._prepared = weakref.WeakKeyDictionary()
+        # sql -> result column names, identical on every connection
+        self._prepared_columns = {}
         self._init_db_info()
-        mode_str = 'Distributed' if self._is_distributed else 'Centralized'
+        self._queries = _QUERIES_BY_MODE[self._is_distributed]
+        # Mode-dependent response values, fixed once the mode is known
+        self._mode = "distributed" if self._is_distributed else "centralized"
+        self._activity_view = "pgxc_stat_activity" if self._is_distributed else "pg_stat_activity"
+        self._db_info = {
+            "type": "gaussdb",
+            "mode": self._mode,
+            "version": self.db_version,
+            "version_num": self.db_version_num,
+            "version_full": self.db_version_full,
+            "host": self.db_config.get("host"),
+            "database": self.db_config.get("database"),
+            "is_distributed": self._is_distributed
+        }
         logger.info(f"GaussDB tools initialized: {db_config['host']}:{db_config['database']} "
-                    f"(GaussDB {self.db_version}, {mode_str})")
+                    f"(GaussDB {self.db_version}, {self._mode.capitalize()})")
 
     @property
     def db_type(self) -> str:
@@ -38,7 +412,6 @@ class GaussDBTools(BaseDatabaseTools):
         Args:
             retries: Number of retry attempts for transient failures
         """
-        import time
         last_error = None
         for attempt in range(retries):
             try:
@@ -47,401 +420,410 @@ class GaussDBTools(BaseDatabaseTools):
                     port=int(self.db_config.get("port", 5432)),
                     database=self.db_config.get("database"),
                     user=self.db_config.get("user"),
-                    password=self.db_config.get("password")
+                    password=self.db_config.get("password"),
+                    application_name=_APPLICATION_NAME
                 )
-            except Exception as e:
+            except (OSError, pg8000.InterfaceError) as e:
+                # Transient connection errors: socket failures (refused, timeout)
+                # and pg8000's wrapper around them. Server-side errors such as
+                # bad credentials are DatabaseError and propagate immediately.
                 last_error = e
-                error_msg = str(e).lower()
-                # Retry on transient connection errors
-                if attempt < retries - 1 and (
-                    "connection" in error_msg or
-                    "timeout" in error_msg or
-                    "refused" in error_msg
-                ):
+                if attempt < retries - 1:
                     logger.warning(f"Connection attempt {attempt + 1} failed: {e}, retrying...")
                     time.sleep(0.5 * (attempt + 1))  # Exponential backoff
                 else:
                     raise
         raise last_error
 
-    def _init_db_info(self):
-        """Initialize database information, detect Centralized/Distributed mode"""
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-
-            # Get version information
-            cur.execute("SELECT version()")
-            self.db_version_full = cur.fetchone()[0]
-
-            # Parse version number (e.g., "GaussDB Kernel V500R002C10" or "(GaussDB 8.1.3)")
-            match = re.search(r'V(\d+)R(\d+)C(\d+)|(\d+)\.(\d+)\.(\d+)', self.db_version_full)
-            if match:
-                groups = [g for g in match.groups() if g]
-                if len(groups) >= 3:
-                    self.db_version = f"{groups[0]}.{groups[1]}.{groups[2]}"
-                    try:
-                        self.db_version_num = int(groups[0]) * 10000 + int(groups[1]) * 100 + int(groups[2])
-                    except ValueError:
-                        self.db_version_num = 0
-                else:
-                    self.db_version = "unknown"
-                    self.db_version_num = 0
-            else:
-                self.db_version = "unknown"
-                self.db_version_num = 0
+    def _invalidate_perf_cache(self):
+        """Also drop cached catalog lookups when the schema may have changed"""
+        super()._invalidate_perf_cache()
+        with self._meta_lock:
+            self._meta_cache.clear()
+
+    def _cache_lookup(self, key: tuple, ttl: float):
+        """Return a copy of a cached result younger than ttl, else None"""
+        with self._meta_lock:
+            cached = self._meta_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                self._meta_cache.move_to_end(key)
+                return dict(cached[1])
+        return None
+
+    @contextmanager
+    def _conn(self, autocommit: bool = False):
+        """Borrow a pooled connection for the duration of a with-block
+
+        Idle connections are reused (most recently returned first) and
+        pinged only when they have been idle for a while. On a clean exit
+        any open transaction is rolled back and the connection goes back to
+        the pool; if the block raises, the connection is discarded.
 
-            # Detect distributed mode (check pgxc_node table)
+        Args:
+            autocommit: Run the borrowed connection in autocommit mode
+        """
+        conn = None
+        while conn is None:
             try:
-                cur.execute("SELECT count(*) FROM pgxc_node WHERE node_type IN ('C', 'D')")
-                node_count = cur.fetchone()[0]
-                self._is_distributed = node_count > 1
-            except Exception:
-                conn.rollback()
-                self._is_distributed = False
+                conn, last_used = self._pool.get_nowait()
+            except queue.Empty:
+                conn = self.get_connection()
+                break
+            if time.monotonic() - last_used > _POOL_IDLE_CHECK_SECONDS:
+                try:
+                    conn.run("SELECT 1")
+                    conn.rollback()
+                except Exception:
+                    self._discard(conn)
+                    conn = None
+
+        conn.autocommit = autocommit
+        try:
+            yield conn
+        except BaseException:
+            self._discard(conn)
+            raise
 
+        try:
+            if conn._in_transaction:
+                conn.rollback()
+            conn.autocommit = False
+            self._pool.put_nowait((conn, time.monotonic()))
+        except queue.Full:
+            self._discard(conn)
         except Exception as e:
-            logger.warning(f"Failed to get GaussDB version info: {e}")
-            self.db_version = "unknown"
-            self.db_version_num = 0
-            self.db_version_full = "unknown"
-        finally:
+            logger.debug(f"Dropping GaussDB connection after release failure: {e}")
+            self._discard(conn)
+
+    @staticmethod
+    def _discard(conn):
+        """Close a connection that is not going back to the pool"""
+        try:
             conn.close()
+        except Exception:
+            pass
+
+    def close(self):
+        """Close every idle pooled connection"""
+        _drain_pool(self._pool)
+
+    @staticmethod
+    def _truncate_query_text(rows: List[Dict[str, Any]], length: int) -> List[Dict[str, Any]]:
+        """Shorten the 'query' column of activity rows in place"""
+        for row in rows:
+            query = row.get("query")
+            if query and len(query) > length:
+                row["query"] = query[:length]
+        return rows
+
+    @staticmethod
+    def _fetch_capped(cur, max_rows: int = MAX_ROWS):
+        """Convert at most max_rows rows of an executed cursor into dicts
+
+        Returns:
+            (rows, truncated) where truncated tells whether rows were dropped
+        """
+        if cur.description is None:
+            return [], False
+        columns = tuple(desc[0] for desc in cur.description)
+        rows = [dict(zip(columns, row)) for row in islice(cur, max_rows)]
+        truncated = len(rows) == max_rows and next(iter(cur), None) is not None
+        return rows, truncated
+
+    def _prepare_cached(self, conn, sql: str):
+        """Return a server-side prepared statement for sql on conn
+
+        Statements are prepared once per pooled connection and reused, so
+        repeated calls skip the parse/plan step. sql uses :name placeholders.
+        """
+        statements = self._prepared.get(conn)
+        if statements is None:
+            statements = self._prepared[conn] = OrderedDict()
+        ps = statements.get(sql)
+        if ps is None:
+            ps = statements[sql] = conn.prepare(sql)
+            if len(statements) > _PREPARED_PER_CONN:
+                _, evicted = statements.popitem(last=False)
+                self._close_prepared(evicted)
+        else:
+            statements.move_to_end(sql)
+        return ps
+
+    @staticmethod
+    def _close_prepared(ps):
+        """Deallocate a prepared statement, ignoring a dead connection"""
+        try:
+            ps.close()
+        except Exception:
+            pass
+
+    def _forget_prepared(self, conn, sql: str):
+        """Drop a cached prepared statement, e.g. after its table changed shape"""
+        ps = self._prepared.get(conn, {}).pop(sql, None)
+        if ps is not None:
+            self._close_prepared(ps)
+
+    def _fetch_prepared(self, conn, sql: str, **params):
+        """Run a prepared catalog query and return (columns, row tuples)
+
+        Lets callers give the connection back before shaping the rows.
+        """
+        ps = self._prepare_cached(conn, sql)
+        rows = ps.run(**params)
+        if not rows:
+            # Common for lock/activity views on an idle server
+            return (), rows
+        columns = self._prepared_columns.get(sql)
+        if columns is None:
+            columns = tuple(col["name"] for col in ps.row_desc or ())
+            self._prepared_columns[sql] = columns
+        return columns, rows
+
+    def _run_prepared(self, conn, sql: str, **params) -> List[Dict[str, Any]]:
+        """Run a prepared catalog query and return its rows as dicts"""
+        columns, rows = self._fetch_prepared(conn, sql, **params)
+        return [dict(zip(columns, row)) for row in rows]
+
+    def _info_cache_key(self) -> tuple:
+        """Key identifying the server this instance talks to"""
+        return (
+            self.db_config.get("host", "localhost"),
+            int(self.db_config.get("port", 5432)),
+            self.db_config.get("database"),
+            self.db_config.get("user"),
+        )
+
+    @staticmethod
+    def invalidate_info_cache():
+        """Forget cached version / distribution info for every GaussDB server"""
+        with _DB_INFO_LOCK:
+            _DB_INFO_CACHE.clear()
+
+    def _init_db_info(self):
+        """Initialize database information, detect Centralized/Distributed mode
+
+        Results are shared across instances pointing at the same server for
+        _DB_INFO_TTL seconds, so constructing tools per request does not
+        repeat the version and pgxc_node probes.
+        """
+        key = self._info_cache_key()
+        with _DB_INFO_LOCK:
+            cached = _DB_INFO_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _DB_INFO_TTL:
+            (_, self.db_version, self.db_version_num,
+             self.db_version_full, self._is_distributed) = cached
+            return
+
+        self._load_db_info()
+        if self.db_version_full != "unknown":
+            with _DB_INFO_LOCK:
+                _DB_INFO_CACHE[key] = (
+                    time.monotonic(), self.db_version, self.db_version_num,
+                    self.db_version_full, self._is_distributed
+                )
+
+    def _load_db_info(self):
+        """Query version information and detect distributed mode"""
+        with self._conn(autocommit=True) as conn:
+            try:
+                cur = conn.cursor()
+
+                # Get version information, and whether pgxc_node exists at all
+                cur.execute("""
+                    SELECT version(), EXISTS (
+                        SELECT 1 FROM pg_catalog.pg_class c
+                        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                        WHERE n.nspname = 'pg_catalog' AND c.relname = 'pgxc_node'
+                    )
+                """)
+                self.db_version_full, has_pgxc_node = cur.fetchone()
+
+                self.db_version, self.db_version_num = _parse_version(self.db_version_full)
+
+                # Detect distributed mode (check pgxc_node table). Skipped when
+                # the catalog has no pgxc_node, avoiding a failed query + rollback
+                self._is_distributed = False
+                if has_pgxc_node:
+                    try:
+                        cur.execute("SELECT count(*) FROM pgxc_node WHERE node_type IN ('C', 'D')")
+                        node_count = cur.fetchone()[0]
+                        self._is_distributed = node_count > 1
+                    except Exception as e:
+                        # Autocommit connection, so a failed probe leaves nothing to roll back
+                        logger.debug(f"pgxc_node probe failed: {e}")
+
+            except Exception as e:
+                logger.warning(f"Failed to get GaussDB version info: {e}")
+                self.db_version = "unknown"
+                self.db_version_num = 0
+                self.db_version_full = "unknown"
 
     def get_db_info(self) -> Dict[str, Any]:
         """Get database information"""
-        mode = "distributed" if self._is_distributed else "centralized"
-        return {
-            "type": "gaussdb",
-            "mode": mode,
-            "version": self.db_version,
-            "version_num": self.db_version_num,
-            "version_full": self.db_version_full,
-            "host": self.db_config.get("host"),
-            "database": self.db_config.get("database"),
-            "is_distributed": self._is_distributed
-        }
+        # Everything here is fixed at construction; copy so callers can't mutate it
+        return dict(self._db_info)
 
     def get_running_queries(self, limit: int = 20) -> Dict[str, Any]:
         """Get currently running queries"""
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-
-            if self._is_distributed:
-                # Distributed mode uses PGXC_STAT_ACTIVITY
-                query = """
-                    SELECT
-                        coorname,
-                        pid,
-                        usename,
-                        datname,
-                        application_name,
-                        client_addr,
-                        state,
-                        waiting,
-                        query_start,
-                        now() - query_start AS duration,
-                        query_id,
-                        LEFT(query, 500) as query
-                    FROM pgxc_stat_activity
-                    WHERE state = 'active'
-                      AND query NOT LIKE '%%pgxc_stat_activity%%'
-                    ORDER BY query_start
-                    LIMIT %s
-                """
-            else:
-                # Centralized mode uses PG_STAT_ACTIVITY
-                query = """
-                    SELECT
-                        pid,
-                        usename,
-                        datname,
-                        application_name,
-                        client_addr,
-                        state,
-                        waiting,
-                        query_start,
-                        now() - query_start AS duration,
-                        query_id,
-                        LEFT(query, 500) as query
-                    FROM pg_stat_activity
-                    WHERE state = 'active'
-                      AND pid != pg_backend_pid()
-                    ORDER BY query_start
-                    LIMIT %s
-                """
-
-            cur.execute(query, (limit,))
+        with self._conn(autocommit=True) as conn:
+            try:
+                results = self._truncate_query_text(
+                    self._run_prepared(conn, self._queries["running_queries"], limit=limit),
+                    _QUERY_PREVIEW_LEN
+                )
 
-            if cur.description is None:
                 return {
                     "status": "success",
-                    "mode": "distributed" if self._is_distributed else "centralized",
-                    "count": 0,
-                    "queries": []
+                    "mode": self._mode,
+                    "count": len(results),
+                    "queries": results
                 }
 
-            columns = [desc[0] for desc in cur.description]
-            results = [dict(zip(columns, row)) for row in cur.fetchall()]
-
-            return {
-                "status": "success",
-                "mode": "distributed" if self._is_distributed else "centralized",
-                "count": len(results),
-                "queries": results
-            }
-
-        except Exception as e:
-            return {"status": "error", "error": str(e)}
-        finally:
-            conn.close()
+            except Exception as e:
+                return {"status": "error", "error": str(e)}
 
     def identify_slow_queries(self, min_duration_ms: float = 1000, limit: int = 20) -> Dict[str, Any]:
         """Identify slow queries"""
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-
-            if self._is_distributed:
-                # Distributed: Use PGXC_STAT_ACTIVITY for current slow queries
-                query = """
-                    SELECT
-                        coorname,
-                        pid,
-                        usename,
-                        datname,
-                        state,
-                        query_start,
-                        EXTRACT(EPOCH FROM (now() - query_start)) * 1000 AS duration_ms,
-                        query_id,
-                        LEFT(query, 500) as query
-                    FROM pgxc_stat_activity
-                    WHERE state = 'active'
-                      AND query_start < now() - interval '%s milliseconds'
-                    ORDER BY query_start
-                    LIMIT %s
-                """
-            else:
-                # Centralized: Use PG_STAT_ACTIVITY
-                query = """
-                    SELECT
-                        pid,
-                        usename,
-                        datname,
-                        state,
-                        query_start,
-                        EXTRACT(EPOCH FROM (now() - query_start)) * 1000 AS duration_ms,
-                        query_id,
-                        LEFT(query, 500) as query
-                    FROM pg_stat_activity
-                    WHERE state = 'active'
-                      AND query_start < now() - interval '%s milliseconds'
-                      AND pid != pg_backend_pid()
-                    ORDER BY query_start
-                    LIMIT %s
-                """
-
-            cur.execute(query, (min_duration_ms, limit))
+        with self._conn(autocommit=True) as conn:
+            try:
+                results = self._truncate_query_text(
+                    self._run_prepared(conn, self._queries["slow_queries"],
+                                       min_duration_ms=float(min_duration_ms), limit=limit),
+                    _QUERY_PREVIEW_LEN
+                )
 
-            if cur.description is None:
                 return {
                     "status": "success",
-                    "source": "pgxc_stat_activity" if self._is_distributed else "pg_stat_activity",
-                    "count": 0,
-                    "queries": []
+                    "source": self._activity_view,
+                    "count": len(results),
+                    "queries": results
                 }
 
-            columns = [desc[0] for desc in cur.description]
-            results = [dict(zip(columns, row)) for row in cur.fetchall()]
-
-            return {
-                "status": "success",
-                "source": "pgxc_stat_activity" if self._is_distributed else "pg_stat_activity",
-                "count": len(results),
-                "queries": results
-            }
-
-        except Exception as e:
-            return {"status": "error", "error": str(e)}
-        finally:
-            conn.close()
+            except Exception as e:
+                return {"status": "error", "error": str(e)}
 
-    def run_explain(self, sql: str, analyze: bool = False) -> Dict[str, Any]:
+    def run_explain(self, sql: str, analyze: bool = False) -> ExplainResult:
         """Analyze SQL execution plan"""
         logger.info(f"Running EXPLAIN analysis: analyze={analyze}")
         logger.debug(f"SQL: {sql[:100]}...")
 
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
+        with self._conn(autocommit=not analyze) as conn:
+            try:
+                # Decode the json plan column with the faster parser when available
+                conn.register_in_adapter(JSON_TYPE_OID, _parse_explain_json)
+                cur = conn.cursor()
 
-            if analyze:
-                explain_sql = f"EXPLAIN ANALYZE {sql}"
-                cur.execute(explain_sql)
-                results = cur.fetchall()
-                result = "\n".join([row[0] for row in results])
-            else:
-                explain_sql = f"EXPLAIN (FORMAT JSON) {sql}"
-                cur.execute(explain_sql)
-                result = cur.fetchone()[0]
+                if analyze:
+                    explain_sql = _EXPLAIN_ANALYZE_PREFIX + sql
+                    cur.execute(explain_sql)
+                    result = "\n".join(row[0] for row in cur)
+                else:
+                    explain_sql = _EXPLAIN_JSON_PREFIX + sql
+                    cur.execute(explain_sql)
+                    result = cur.fetchone()[0]
 
-            logger.info("EXPLAIN analysis completed")
+                logger.info("EXPLAIN analysis completed")
 
-            return {
-                "status": "success",
-                "explain_output": result,
-                "analyzed": analyze,
-                "sql": sql
-            }
+                return {
+                    "status": "success",
+                    "explain_output": result,
+                    "analyzed": analyze,
+                    "sql": sql
+                }
 
-        except Exception as e:
-            logger.error(f"EXPLAIN analysis failed: {e}")
-            return {
-                "status": "error",
-                "error": str(e),
-                "sql": sql
-            }
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"EXPLAIN analysis failed: {e}")
+                return {
+                    "status": "error",
+                    "error": str(e),
+                    "sql": sql
+                }
 
+    @_metadata_cached
     def check_index_usage(self, table_name: str, schema: str = "public") -> Dict[str, Any]:
         """Check index usage for a table"""
-        logger.info(f"Checking index usage: {schema}.{table_name}")
-
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-
-            # Get index information
-            query = """
-                SELECT
-                    i.indexname,
-                    i.indexdef,
-                    s.idx_scan,
-                    s.idx_tup_read,
-                    s.idx_tup_fetch,
-                    pg_size_pretty(pg_relation_size(i.schemaname||'.'||i.indexname)) as index_size,
-                    pg_relation_size(i.schemaname||'.'||i.indexname) as index_size_bytes
-                FROM pg_indexes i
-                LEFT JOIN pg_stat_user_indexes s
-                    ON i.schemaname = s.schemaname
-                    AND i.indexname = s.indexrelname
-                WHERE i.schemaname = %s AND i.tablename = %s
-                ORDER BY s.idx_scan DESC NULLS LAST;
-            """
-
-            cur.execute(query, (schema, table_name))
-            columns = [desc[0] for desc in cur.description]
-            indexes = [dict(zip(columns, row)) for row in cur.fetchall()]
-
-            # Analysis
-            unused_indexes = [idx for idx in indexes if idx['idx_scan'] == 0 or idx['idx_scan'] is None]
-            total_size = sum(idx['index_size_bytes'] or 0 for idx in indexes)
-
-            logger.info(f"Found {len(indexes)} indexes, {len(unused_indexes)} unused")
-
-            return {
-                "status": "success",
-                "table": f"{schema}.{table_name}",
-                "total_indexes": len(indexes),
-                "unused_count": len(unused_indexes),
-                "total_size": total_size,
-                "indexes": indexes,
-                "analysis": {
-                    "has_unused_indexes": len(unused_indexes) > 0,
-                    "unused_indexes": unused_indexes
-                }
-            }
-
-        except Exception as e:
-            logger.error(f"Index check failed: {e}")
-            return {
-                "status": "error",
-                "error": str(e)
-            }
-        finally:
-            conn.close()
-
-    def get_table_stats(self, table_name: str, schema: str = "public") -> Dict[str, Any]:
-        """Get table statistics"""
-        logger.info(f"Getting table stats: {schema}.{table_name}")
-
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
+        table_ref = f"{schema}.{table_name}"
+        logger.info(f"Checking index usage: {table_ref}")
 
-            if self._is_distributed:
-                # Distributed mode: use PGXC_STAT_TABLE if available
-                query = """
-                    SELECT
-                        schemaname,
-                        relname as tablename,
-                        pg_size_pretty(pg_total_relation_size(schemaname||'.'||relname)) as total_size,
-                        pg_size_pretty(pg_relation_size(schemaname||'.'||relname)) as table_size,
-                        pg_size_pretty(pg_indexes_size(schemaname||'.'||relname)) as indexes_size,
-                        n_live_tup,
-                        n_dead_tup,
-                        ROUND(100.0 * n_dead_tup / NULLIF(n_live_tup + n_dead_tup, 0), 2) as dead_ratio,
-                        last_vacuum,
-                        last_autovacuum,
-                        last_analyze,
-                        last_autoanalyze,
-                        seq_scan,
-                        seq_tup_read,
-                        idx_scan,
-                        idx_tup_fetch
-                    FROM pg_stat_user_tables
-                    WHERE schemaname = %s AND relname = %s;
-                """
-            else:
+        with self._conn(autocommit=True) as conn:
+            try:
+                # Get index information
                 query = """
                     SELECT
-                        schemaname,
-                        relname as tablename,
-                        pg_size_pretty(pg_total_relation_size(schemaname||'.'||relname)) as total_size,
-                        pg_size_pretty(pg_relation_size(schemaname||'.'||relname)) as table_size,
-                        pg_size_pretty(pg_indexes_size(schemaname||'.'||relname)) as indexes_size,
-                        n_live_tup,
-                        n_dead_tup,
-                        ROUND(100.0 * n_dead_tup / NULLIF(n_live_tup + n_dead_tup, 0), 2) as dead_ratio,
-                        last_vacuum,
-                        last_autovacuum,
-                        last_analyze,
-                        last_autoanalyze,
-                        seq_scan,
-                        seq_tup_read,
-                        idx_scan,
-                        idx_tup_fetch
-                    FROM pg_stat_user_tables
-                    WHERE schemaname = %s AND relname = %s;
+                        i.indexname,
+                        i.indexdef,
+                        s.idx_scan,
+                        s.idx_tup_read,
+                        s.idx_tup_fetch,
+                        pg_size_pretty(pg_relation_size(i.schemaname||'.'||i.indexname)) as index_size,
+                        pg_relation_size(i.schemaname||'.'||i.indexname) as index_size_bytes
+                    FROM pg_indexes i
+                    LEFT JOIN pg_stat_user_indexes s
+                        ON i.schemaname = s.schemaname
+                        AND i.indexname = s.indexrelname
+                    WHERE i.schemaname = :schema AND i.tablename = :table_name
+                    ORDER BY s.idx_scan DESC NULLS LAST;
                 """
 
-            cur.execute(query, (schema, table_name))
-            columns = [desc[0] for desc in cur.description]
-            result = cur.fetchone()
+                indexes = self._run_prepared(conn, query, schema=schema, table_name=table_name)
+
+                # Analysis
+                unused_indexes = []
+                total_size = 0
+                for idx in indexes:
+                    total_size += idx['index_size_bytes'] or 0
+                    if not idx['idx_scan']:
+                        unused_indexes.append(idx)
+
+                logger.info(f"Found {len(indexes)} indexes, {len(unused_indexes)} unused")
 
-            if result:
-                stats = dict(zip(columns, result))
-                logger.info("Table stats retrieved successfully")
                 return {
                     "status": "success",
-                    "stats": stats
+                    "table": table_ref,
+                    "total_indexes": len(indexes),
+                    "unused_count": len(unused_indexes),
+                    "total_size": total_size,
+                    "indexes": indexes,
+                    "analysis": {
+                        "has_unused_indexes": len(unused_indexes) > 0,
+                        "unused_indexes": unused_indexes
+                    }
                 }
-            else:
+
+            except Exception as e:
+                logger.error(f"Index check failed: {e}")
                 return {
                     "status": "error",
-                    "error": t("db_table_not_found", schema=schema, table=table_name)
+                    "error": str(e)
                 }
 
-        except Exception as e:
-            logger.error(f"Failed to get table stats: {e}")
-            return {
-                "status": "error",
-                "error": str(e)
-            }
-        finally:
-            conn.close()
+    def get_table_stats(self, table_name: str, schema: str = "public") -> Dict[str, Any]:
+        """Get table statistics"""
+        logger.info(f"Getting table stats: {schema}.{table_name}")
+
+        with self._conn(autocommit=True) as conn:
+            try:
+                rows = self._run_prepared(conn, self._queries["table_stats"], schema=schema, table_name=table_name)
+
+                if rows:
+                    stats = rows[0]
+                    logger.info("Table stats retrieved successfully")
+                    return {
+                        "status": "success",
+                        "stats": stats
+                    }
+                else:
+                    return {
+                        "status": "error",
+                        "error": t("db_table_not_found", schema=schema, table=table_name)
+                    }
+
+            except Exception as e:
+                logger.error(f"Failed to get table stats: {e}")
+                return {
+                    "status": "error",
+                    "error": str(e)
+                }
 
     def create_index(self, index_sql: str, concurrent: bool = True) -> Dict[str, Any]:
         """Create index"""
@@ -449,345 +831,359 @@ class GaussDBTools(BaseDatabaseTools):
         logger.info(f"SQL: {index_sql}")
 
         # Safety check
-        if not index_sql.strip().upper().startswith("CREATE INDEX"):
+        m = _CREATE_INDEX_RE.match(index_sql)
+        if not m:
             return {
                 "status": "error",
                 "error": t("db_only_create_index")
             }
 
         # Add CONCURRENTLY (GaussDB supports this like PostgreSQL)
-        if concurrent and "CONCURRENTLY" not in index_sql.upper():
-            index_sql = index_sql.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+        if concurrent and not m.group(1):
+            index_sql = f"{index_sql[:m.end()]} CONCURRENTLY{index_sql[m.end():]}"
 
-        conn = self.get_connection()
-        conn.autocommit = True
-
-        try:
-            cur = conn.cursor()
-            cur.execute(index_sql)
+        with self._conn(autocommit=True) as conn:
+            try:
+                cur = conn.cursor()
+                cur.execute(index_sql)
 
-            logger.info("Index created successfully")
+                self._invalidate_perf_cache()
+                logger.info("Index created successfully")
 
-            return {
-                "status": "success",
-                "message": t("db_index_created"),
-                "sql": index_sql
-            }
+                return {
+                    "status": "success",
+                    "message": t("db_index_created"),
+                    "sql": index_sql
+                }
 
-        except Exception as e:
-            logger.error(f"Index creation failed: {e}")
-            return {
-                "status": "error",
-                "error": str(e),
-                "sql": index_sql
-            }
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"Index creation failed: {e}")
+                return {
+                    "status": "error",
+                    "error": str(e),
+                    "sql": index_sql
+                }
 
     def analyze_table(self, table_name: str, schema: str = "public") -> Dict[str, Any]:
         """Update table statistics (ANALYZE)"""
         logger.info(f"Updating statistics: {schema}.{table_name}")
 
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-            cur.execute(f"ANALYZE {schema}.{table_name};")
-            conn.commit()
+        with self._conn() as conn:
+            try:
+                cur = conn.cursor()
+                cur.execute(f"ANALYZE {_qualified_name(schema, table_name)};")
+                conn.commit()
 
-            logger.info("Statistics updated successfully")
+                self._invalidate_perf_cache()
+                logger.info("Statistics updated successfully")
 
-            return {
-                "status": "success",
-                "message": t("db_stats_updated", schema=schema, table=table_name)
-            }
+                return {
+                    "status": "success",
+                    "message": t("db_stats_updated", schema=schema, table=table_name)
+                }
 
-        except Exception as e:
-            logger.error(f"Failed to update statistics: {e}")
-            conn.rollback()
-            return {
-                "status": "error",
-                "error": str(e)
-            }
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"Failed to update statistics: {e}")
+                conn.rollback()
+                return {
+                    "status": "error",
+                    "error": str(e)
+                }
 
-    def execute_safe_query(self, sql: str) -> Dict[str, Any]:
+    def execute_safe_query(self, sql: str) -> QueryResult:
         """Execute safe read-only query"""
         logger.info("Executing safe query")
         logger.debug(f"SQL: {sql[:100]}...")
 
         # Clean up the SQL
         sql = sql.strip()
-        sql_upper = sql.upper()
 
         # Auto-fix: If SQL looks like SELECT columns but missing SELECT keyword, prepend it
-        if not (sql_upper.startswith("SELECT") or
-                sql_upper.startswith("SHOW") or
-                sql_upper.startswith("EXPLAIN") or
-                sql_upper.startswith("WITH")):
+        is_safe = _SAFE_QUERY_RE.match(sql) is not None
+        if not is_safe:
             # Check if it looks like a SELECT expression (contains AS, column aliases, or functions)
-            if " AS " in sql_upper or "(" in sql or "," in sql:
+            if "(" in sql or "," in sql or _AS_KEYWORD_RE.search(sql):
                 sql = "SELECT " + sql
-                sql_upper = sql.upper()
+                is_safe = True
                 logger.info(f"Auto-prepended SELECT to query")
 
-        # Safety check - allow read-only statements
-        is_safe = (
-            sql_upper.startswith("SELECT") or
-            sql_upper.startswith("SHOW") or
-            sql_upper.startswith("EXPLAIN") or
-            sql_upper.startswith("WITH")  # CTE queries
-        )
+        # Safety check - allow read-only statements (SELECT, SHOW, EXPLAIN, WITH)
         if not is_safe:
             return {
                 "status": "error",
                 "error": t("db_only_select")
             }
 
-        func_check = self._check_function_call_in_select(sql_upper)
+        func_check = self._check_function_call_in_select(sql)
         if func_check:
             return func_check
 
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-            cur.execute(sql)
+        with self._conn() as conn:
+            try:
+                cur = conn.cursor()
+                cur.execute(sql)
 
-            columns = [desc[0] for desc in cur.description] if cur.description else []
-            results = [dict(zip(columns, row)) for row in cur.fetchall()] if columns else []
+                results, truncated = self._fetch_capped(cur)
 
-            logger.info(f"Query successful, returned {len(results)} rows")
+                logger.info(f"Query successful, returned {len(results)} rows"
+                            f"{' (truncated)' if truncated else ''}")
 
-            return {
-                "status": "success",
-                "count": len(results),
-                "rows": results
-            }
+                return {
+                    "status": "success",
+                    "count": len(results),
+                    "rows": results,
+                    "truncated": truncated
+                }
 
-        except Exception as e:
-            logger.error(f"Query failed: {e}")
-            return {
-                "status": "error",
-                "error": str(e)
-            }
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"Query failed: {e}")
+                return {
+                    "status": "error",
+                    "error": str(e)
+                }
 
     def execute_sql(self, sql: str, confirmed: bool = False) -> Dict[str, Any]:
         """Execute any SQL statement (INSERT/UPDATE/DELETE/CREATE/ALTER/DROP etc.)"""
-        sql_upper = sql.strip().upper()
-
         # Read-only queries execute directly without confirmation
-        is_readonly = (
-            sql_upper.startswith("SELECT") or
-            sql_upper.startswith("SHOW") or
-            sql_upper.startswith("EXPLAIN")
-        )
+        if _READONLY_SQL_RE.match(sql):
+            with self._conn() as conn:
+                try:
+                    cur = conn.cursor()
+                    cur.execute(sql)
+                    results, truncated = self._fetch_capped(cur)
+                    return {
+                        "status": "success",
+                        "type": "query",
+                        "count": len(results),
+                        "rows": results,
+                        "truncated": truncated
+                    }
+                except Exception as e:
+                    return {
+                        "status": "error",
+                        "error": str(e),
+                        "sql": sql
+                    }
 
-        if is_readonly:
-            conn = self.get_connection()
+        # Non-read-only operations require confirmation
+        if not confirmed:
+            return {
+                "status": "pending_confirmation",
+                "sql": sql,
+                "message": t("db_need_confirm")
+            }
+
+        # Check if SQL requires autocommit (cannot run inside transaction block)
+        needs_autocommit = _AUTOCOMMIT_SQL_RE.match(sql) is not None
+
+        # Confirmed, execute operation
+        with self._conn(autocommit=needs_autocommit) as conn:
             try:
                 cur = conn.cursor()
                 cur.execute(sql)
-                columns = [desc[0] for desc in cur.description] if cur.description else []
-                results = [dict(zip(columns, row)) for row in cur.fetchall()] if columns else []
+                rowcount = cur.rowcount
+                if not needs_autocommit:
+                    conn.commit()
+                self._invalidate_perf_cache()
                 return {
                     "status": "success",
-                    "type": "query",
-                    "count": len(results),
-                    "rows": results
+                    "type": "execute",
+                    "affected_rows": rowcount,
+                    "message": t("db_execute_success", count=rowcount)
                 }
+
             except Exception as e:
+                if not needs_autocommit:
+                    conn.rollback()
+                logger.error(f"SQL execution failed: {e}")
                 return {
                     "status": "error",
                     "error": str(e),
                     "sql": sql
                 }
-            finally:
-                conn.close()
 
-        # Non-read-only operations require confirmation
-        if not confirmed:
-            return {
-                "status": "pending_confirmation",
-                "sql": sql,
-                "message": t("db_need_confirm")
-            }
+    @_metadata_cached
+    def list_tables(self, schema: str = "public") -> ListTablesResult:
+        """List all tables in the database"""
+        logger.info(f"Listing tables: schema={schema}")
 
-        # Check if SQL requires autocommit (cannot run inside transaction block)
-        needs_autocommit = (
-            sql_upper.startswith("CREATE DATABASE") or
-            sql_upper.startswith("DROP DATABASE") or
-            sql_upper.startswith("VACUUM")
-        )
+        with self._conn(autocommit=True) as conn:
+            try:
+                tables = self._run_prepared(conn, """
+                    SELECT
+                        tablename,
+                        pg_size_pretty(size_bytes) as total_size,
+                        size_bytes
+                    FROM (
+                        SELECT
+                            tablename,
+                            pg_total_relation_size(schemaname||'.'||tablename) as size_bytes
+                        FROM pg_tables
+                        WHERE schemaname = :schema
+                    ) t
+                    ORDER BY size_bytes DESC;
+                """, schema=schema)
+
+                logger.info(f"Found {len(tables)} tables")
 
-        # Confirmed, execute operation
-        conn = self.get_connection()
-        if needs_autocommit:
-            conn.autocommit = True
-        try:
-            cur = conn.cursor()
-            cur.execute(sql)
-            rowcount = cur.rowcount
-            if not needs_autocommit:
-                conn.commit()
-            return {
-                "status": "success",
-                "type": "execute",
-                "affected_rows": rowcount,
-                "message": t("db_execute_success", count=rowcount)
-            }
+                return {
+                    "status": "success",
+                    "schema": schema,
+                    "count": len(tables),
+                    "tables": tables
+                }
 
-        except Exception as e:
-            if not needs_autocommit:
-                conn.rollback()
-            logger.error(f"SQL execution failed: {e}")
-            return {
-                "status": "error",
-                "error": str(e),
-                "sql": sql
-            }
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"Failed to list tables: {e}")
+                return {
+                    "status": "error",
+                    "error": str(e)
+                }
 
-    def list_tables(self, schema: str = "public") -> Dict[str, Any]:
-        """List all tables in the database"""
-        logger.info(f"Listing tables: schema={schema}")
+    @_metadata_cached
+    def describe_table(self, table_name: str, schema: str = "public") -> DescribeTableResult:
+        """Get table structure information"""
+        table_ref = f"{schema}.{table_name}"
+        logger.info(f"Getting table structure: {table_ref}")
 
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT
-                    tablename,
-                    pg_size_pretty(pg_total_relation_size(schemaname||'.'||tablename)) as total_size,
-                    pg_total_relation_size(schemaname||'.'||tablename) as size_bytes
-                FROM pg_tables
-                WHERE schemaname = %s
-                ORDER BY pg_total_relation_size(schemaname||'.'||tablename) DESC;
-            """, (schema,))
-
-            columns = [desc[0] for desc in cur.description]
-            tables = [dict(zip(columns, row)) for row in cur.fetchall()]
-
-            logger.info(f"Found {len(tables)} tables")
+        with self._conn(autocommit=True) as conn:
+            try:
+                # Columns, primary key and foreign keys in one round trip;
+                # the first column tells which part each row belongs to
+                rows = self._prepare_cached(conn, """
+                    SELECT 'c' AS part, c.ordinal_position::int AS pos,
+                        c.column_name::text, c.data_type::text,
+                        c.character_maximum_length::int, c.is_nullable::text,
+                        c.column_default::text,
+                        NULL::text AS foreign_table, NULL::text AS foreign_column
+                    FROM information_schema.columns c
+                    WHERE c.table_schema = :schema AND c.table_name = :table_name
+                    UNION ALL
+                    SELECT 'p', 0, a.attname::text, NULL, NULL, NULL, NULL, NULL, NULL
+                    FROM pg_index i
+                    JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                    WHERE i.indrelid = :qualified_name::regclass AND i.indisprimary
+                    UNION ALL
+                    SELECT 'f', 0, kcu.column_name::text, NULL, NULL, NULL, NULL,
+                        ccu.table_name::text, ccu.column_name::text
+                    FROM information_schema.table_constraints tc
+                    JOIN information_schema.key_column_usage kcu
+                        ON tc.constraint_name = kcu.constraint_name
+                    JOIN information_schema.constraint_column_usage ccu
+                        ON ccu.constraint_name = tc.constraint_name
+                    WHERE tc.constraint_type = 'FOREIGN KEY'
+                        AND tc.table_schema = :schema
+                        AND tc.table_name = :table_name
+                    ORDER BY 1, 2;
+                """).run(schema=schema, table_name=table_name,
+                         qualified_name=_qualified_name(schema, table_name))
+
+                cols = []
+                pk_columns = []
+                fks = []
+                for part, _, column, data_type, max_length, nullable, default, f_table, f_column in rows:
+                    if part == 'c':
+                        cols.append({
+                            "column_name": column,
+                            "data_type": data_type,
+                            "character_maximum_length": max_length,
+                            "is_nullable": nullable,
+                            "column_default": default
+                        })
+                    elif part == 'p':
+                        pk_columns.append(column)
+                    else:
+                        fks.append({
+                            "column_name": column,
+                            "foreign_table": f_table,
+                            "foreign_column": f_column
+                        })
+
+                logger.info(f"Table structure retrieved: {len(cols)} columns")
 
-            return {
-                "status": "success",
-                "schema": schema,
-                "count": len(tables),
-                "tables": tables
-            }
+                return {
+                    "status": "success",
+                    "table": table_ref,
+                    "columns": cols,
+                    "primary_key": pk_columns,
+                    "foreign_keys": fks
+                }
 
-        except Exception as e:
-            logger.error(f"Failed to list tables: {e}")
-            return {
-                "status": "error",
-                "error": str(e)
-            }
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"Failed to get table structure: {e}")
+                return {
+                    "status": "error",
+                    "error": str(e)
+                }
 
-    def describe_table(self, table_name: str, schema: str = "public") -> Dict[str, Any]:
-        """Get table structure information"""
-        logger.info(f"Getting table structure: {schema}.{table_name}")
+    def describe_tables(self, table_names: List[str], schema: str = "public") -> Dict[str, Any]:
+        """
+        Get structure information for several tables concurrently
 
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-
-            # Get column information
-            cur.execute("""
-                SELECT
-                    column_name,
-                    data_type,
-                    character_maximum_length,
-                    is_nullable,
-                    column_default
-                FROM information_schema.columns
-                WHERE table_schema = %s AND table_name = %s
-                ORDER BY ordinal_position;
-            """, (schema, table_name))
-
-            columns = [desc[0] for desc in cur.description]
-            cols = [dict(zip(columns, row)) for row in cur.fetchall()]
-
-            # Get primary key information
-            cur.execute("""
-                SELECT a.attname as column_name
-                FROM pg_index i
-                JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
-                WHERE i.indrelid = %s::regclass AND i.indisprimary;
-            """, (f"{schema}.{table_name}",))
-            pk_columns = [row[0] for row in cur.fetchall()]
-
-            # Get foreign key information
-            cur.execute("""
-                SELECT
-                    kcu.column_name,
-                    ccu.table_name AS foreign_table,
-                    ccu.column_name AS foreign_column
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                JOIN information_schema.constraint_column_usage ccu
-                    ON ccu.constraint_name = tc.constraint_name
-                WHERE tc.constraint_type = 'FOREIGN KEY'
-                    AND tc.table_schema = %s
-                    AND tc.table_name = %s;
-            """, (schema, table_name))
-            fk_columns = [desc[0] for desc in cur.description]
-            fks = [dict(zip(fk_columns, row)) for row in cur.fetchall()]
-
-            logger.info(f"Table structure retrieved: {len(cols)} columns")
+        Each table is described on its own pooled connection from a small
+        thread pool, so N tables cost roughly N / workers round-trip
+        latencies instead of N.
 
-            return {
-                "status": "success",
-                "table": f"{schema}.{table_name}",
-                "columns": cols,
-                "primary_key": pk_columns,
-                "foreign_keys": fks
-            }
+        Args:
+            table_names: Table names
+            schema: Schema name
 
-        except Exception as e:
-            logger.error(f"Failed to get table structure: {e}")
-            return {
-                "status": "error",
-                "error": str(e)
-            }
-        finally:
-            conn.close()
+        Returns:
+            Mapping of table name to its describe_table result
+        """
+        if not table_names:
+            return {"status": "success", "schema": schema, "count": 0, "tables": {}}
 
-    def get_sample_data(self, table_name: str, schema: str = "public", limit: int = 10) -> Dict[str, Any]:
-        """Get sample data from a table"""
-        logger.info(f"Getting sample data: {schema}.{table_name}, limit={limit}")
+        workers = min(_DESCRIBE_MAX_WORKERS, len(table_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda name: self.describe_table(name, schema), table_names))
 
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-            cur.execute(f"SELECT * FROM {schema}.{table_name} LIMIT %s;", (limit,))
+        return {
+            "status": "success",
+            "schema": schema,
+            "count": len(results),
+            "tables": dict(zip(table_names, results))
+        }
 
-            columns = [desc[0] for desc in cur.description]
-            rows = [dict(zip(columns, row)) for row in cur.fetchall()]
+    def get_sample_data(self, table_name: str, schema: str = "public", limit: int = 10) -> SampleDataResult:
+        """Get sample data from a table"""
+        table_ref = f"{schema}.{table_name}"
+        logger.info(f"Getting sample data: {table_ref}, limit={limit}")
 
-            logger.info(f"Sample data retrieved: {len(rows)} rows")
+        with self._conn(autocommit=True) as conn:
+            sql = f"SELECT * FROM {_qualified_name(schema, table_name)} LIMIT :limit"
+            try:
+                # Prepared per table, so repeated samples only bind the limit
+                ps = self._prepare_cached(conn, sql)
+                try:
+                    result = ps.run(limit=limit)
+                except pg8000.DatabaseError:
+                    # An altered or recreated table invalidates the cached
+                    # SELECT * plan; prepare it again and retry once
+                    self._forget_prepared(conn, sql)
+                    ps = self._prepare_cached(conn, sql)
+                    result = ps.run(limit=limit)
+
+                columns = [col["name"] for col in ps.row_desc or ()]
+                rows = [dict(zip(columns, row)) for row in result]
+
+                logger.info(f"Sample data retrieved: {len(rows)} rows")
 
-            return {
-                "status": "success",
-                "table": f"{schema}.{table_name}",
-                "columns": columns,
-                "count": len(rows),
-                "rows": rows
-            }
+                return {
+                    "status": "success",
+                    "table": table_ref,
+                    "columns": columns,
+                    "count": len(rows),
+                    "rows": rows
+                }
 
-        except Exception as e:
-            logger.error(f"Failed to get sample data: {e}")
-            return {
-                "status": "error",
-                "error": str(e)
-            }
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"Failed to get sample data: {e}")
+                self._forget_prepared(conn, sql)
+                return {
+                    "status": "error",
+                    "error": str(e)
+                }
 
     def get_node_info(self) -> Dict[str, Any]:
         """Get GaussDB cluster node information (distributed mode only)"""
@@ -799,224 +1195,145 @@ class GaussDBTools(BaseDatabaseTools):
                 "nodes": []
             }
 
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT
-                    node_name,
-                    node_type,
-                    node_host,
-                    node_port,
-                    CASE node_type
-                        WHEN 'C' THEN 'Coordinator'
-                        WHEN 'D' THEN 'Datanode'
-                        ELSE node_type
-                    END as node_type_name
-                FROM pgxc_node
-                ORDER BY node_type, node_name;
-            """)
-
-            columns = [desc[0] for desc in cur.description]
-            nodes = [dict(zip(columns, row)) for row in cur.fetchall()]
-
-            coordinators = [n for n in nodes if n['node_type'] == 'C']
-            datanodes = [n for n in nodes if n['node_type'] == 'D']
-
-            return {
-                "status": "success",
-                "mode": "distributed",
-                "total_nodes": len(nodes),
-                "coordinators": len(coordinators),
-                "datanodes": len(datanodes),
-                "nodes": nodes
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to get node info: {e}")
-            return {
-                "status": "error",
-                "error": str(e)
-            }
-        finally:
-            conn.close()
-
-    def get_thread_wait_status(self, limit: int = 50) -> Dict[str, Any]:
-        """Get thread wait status (useful for diagnosing lock contention)"""
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-
-            if self._is_distributed:
-                query = """
+        with self._conn(autocommit=True) as conn:
+            try:
+                cur = conn.cursor()
+                cur.execute("""
                     SELECT
                         node_name,
-                        db_name,
-                        thread_name,
-                        query_id,
-                        tid,
-                        lwtid,
-                        ptid,
-                        tlevel,
-                        smpid,
-                        wait_status,
-                        wait_event,
-                        LEFT(query, 200) as query
-                    FROM pgxc_thread_wait_status
-                    WHERE wait_status != 'wait cmd'
-                    ORDER BY wait_status
-                    LIMIT %s;
-                """
-            else:
-                query = """
-                    SELECT
-                        db_name,
-                        thread_name,
-                        query_id,
-                        tid,
-                        lwtid,
-                        ptid,
-                        tlevel,
-                        smpid,
-                        wait_status,
-                        wait_event,
-                        LEFT(query, 200) as query
-                    FROM pg_thread_wait_status
-                    WHERE wait_status != 'wait cmd'
-                    ORDER BY wait_status
-                    LIMIT %s;
-                """
-
-            cur.execute(query, (limit,))
+                        node_type,
+                        node_host,
+                        node_port,
+                        CASE node_type
+                            WHEN 'C' THEN 'Coordinator'
+                            WHEN 'D' THEN 'Datanode'
+                            ELSE node_type
+                        END as node_type_name
+                    FROM pgxc_node
+                    ORDER BY node_type, node_name;
+                """)
+
+                nodes = self._rows_to_dicts(cur)
+
+                coordinators = [n for n in nodes if n['node_type'] == 'C']
+                datanodes = [n for n in nodes if n['node_type'] == 'D']
 
-            if cur.description is None:
                 return {
                     "status": "success",
-                    "count": 0,
-                    "threads": []
+                    "mode": "distributed",
+                    "total_nodes": len(nodes),
+                    "coordinators": len(coordinators),
+                    "datanodes": len(datanodes),
+                    "nodes": nodes
                 }
 
-            columns = [desc[0] for desc in cur.description]
-            results = [dict(zip(columns, row)) for row in cur.fetchall()]
-
-            return {
-                "status": "success",
-                "mode": "distributed" if self._is_distributed else "centralized",
-                "count": len(results),
-                "threads": results
-            }
+            except Exception as e:
+                logger.error(f"Failed to get node info: {e}")
+                return {
+                    "status": "error",
+                    "error": str(e)
+                }
 
-        except Exception as e:
-            return {"status": "error", "error": str(e)}
-        finally:
-            conn.close()
+    @_monitoring_cached
+    def get_thread_wait_status(self, limit: int = 50) -> Dict[str, Any]:
+        """Get thread wait status (useful for diagnosing lock contention)"""
+        with self._conn(autocommit=True) as conn:
+            try:
+                columns, rows = self._fetch_prepared(conn, self._queries["thread_wait_status"], limit=limit)
+            except pg8000.Error as e:
+                logger.warning(f"Failed to get thread wait status: {e}")
+                return {"status": "error", "error": str(e)}
+
+        # Rows are shaped after the connection is back in the pool
+        results = self._truncate_query_text(
+            [dict(zip(columns, row)) for row in rows], _THREAD_QUERY_PREVIEW_LEN
+        )
+        return {
+            "status": "success",
+            "mode": self._mode,
+            "count": len(results),
+            "threads": results
+        }
 
+    @_monitoring_cached
     def get_locks_info(self, limit: int = 50) -> Dict[str, Any]:
         """Get lock information"""
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
+        with self._conn(autocommit=True) as conn:
+            try:
+                columns, rows = self._fetch_prepared(conn, self._queries["locks_info"], limit=limit)
+            except pg8000.Error as e:
+                logger.warning(f"Failed to get lock info: {e}")
+                return {"status": "error", "error": str(e)}
+
+        # Rows are shaped after the connection is back in the pool
+        results = self._truncate_query_text(
+            [dict(zip(columns, row)) for row in rows], _QUERY_PREVIEW_LEN
+        )
+        return {
+            "status": "success",
+            "mode": self._mode,
+            "count": len(results),
+            "locks": results
+        }
 
-            if self._is_distributed:
-                query = """
-                    SELECT
-                        locktype,
-                        database,
-                        relation,
-                        page,
-                        tuple,
-                        virtualxid,
-                        transactionid,
-                        classid,
-                        objid,
-                        objsubid,
-                        virtualtransaction,
-                        pid,
-                        mode,
-                        granted,
-                        fastpath
-                    FROM pgxc_locks
-                    WHERE NOT granted
-                    LIMIT %s;
-                """
-            else:
-                query = """
-                    SELECT
-                        locktype,
-                        database,
-                        relation,
-                        page,
-                        tuple,
-                        virtualxid,
-                        transactionid,
-                        classid,
-                        objid,
-                        objsubid,
-                        virtualtransaction,
-                        pid,
-                        mode,
-                        granted,
-                        fastpath
-                    FROM pg_locks
-                    WHERE NOT granted
-                    LIMIT %s;
-                """
+    @_monitoring_cached
+    def get_threads_and_locks(self, limit: int = 50) -> Dict[str, Any]:
+        """Get thread wait status and lock information together
 
-            cur.execute(query, (limit,))
+        Both snapshots are read on one pooled connection, so diagnosing lock
+        contention costs a single checkout instead of two.
+        """
+        with self._conn(autocommit=True) as conn:
+            try:
+                thread_columns, thread_rows = self._fetch_prepared(
+                    conn, self._queries["thread_wait_status"], limit=limit)
+                lock_columns, lock_rows = self._fetch_prepared(
+                    conn, self._queries["locks_info"], limit=limit)
+            except pg8000.Error as e:
+                logger.warning(f"Failed to get threads and locks: {e}")
+                return {"status": "error", "error": str(e)}
+
+        # Rows are shaped after the connection is back in the pool
+        threads = self._truncate_query_text(
+            [dict(zip(thread_columns, row)) for row in thread_rows], _THREAD_QUERY_PREVIEW_LEN
+        )
+        locks = self._truncate_query_text(
+            [dict(zip(lock_columns, row)) for row in lock_rows], _QUERY_PREVIEW_LEN
+        )
+        return {
+            "status": "success",
+            "mode": self._mode,
+            "threads": {"count": len(threads), "threads": threads},
+            "locks": {"count": len(locks), "locks": locks}
+        }
 
-            if cur.description is None:
+    def list_databases(self) -> Dict[str, Any]:
+        """List all databases on the GaussDB server instance"""
+        with self._conn(autocommit=True) as conn:
+            try:
+                cur = conn.cursor()
+                cur.execute("""
+                    SELECT datname AS name,
+                           pg_size_pretty(pg_database_size(datname)) AS size,
+                           pg_catalog.pg_get_userbyid(datdba) AS owner
+                    FROM pg_database
+                    WHERE datistemplate = false
+                    ORDER BY datname
+                """)
+                databases = self._rows_to_dicts(cur)
+                current_db = self.db_config.get("database", "")
+                for db in databases:
+                    db["is_current"] = (db["name"] == current_db)
                 return {
                     "status": "success",
-                    "count": 0,
-                    "locks": [],
-                    "message": "No waiting locks found"
+                    "current_database": current_db,
+                    "instance": f"{self.db_config.get('host', 'localhost')}:{self.db_config.get('port', 5432)}",
+                    "count": len(databases),
+                    "databases": databases
                 }
-
-            columns = [desc[0] for desc in cur.description]
-            results = [dict(zip(columns, row)) for row in cur.fetchall()]
-
-            return {
-                "status": "success",
-                "mode": "distributed" if self._is_distributed else "centralized",
-                "count": len(results),
-                "locks": results
-            }
-
-        except Exception as e:
-            return {"status": "error", "error": str(e)}
-        finally:
-            conn.close()
-
-    def list_databases(self) -> Dict[str, Any]:
-        """List all databases on the GaussDB server instance"""
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT datname AS name,
-                       pg_size_pretty(pg_database_size(datname)) AS size,
-                       pg_catalog.pg_get_userbyid(datdba) AS owner
-                FROM pg_database
-                WHERE datistemplate = false
-                ORDER BY datname
-            """)
-            columns = [desc[0] for desc in cur.description]
-            databases = [dict(zip(columns, row)) for row in cur.fetchall()]
-            current_db = self.db_config.get("database", "")
-            for db in databases:
-                db["is_current"] = (db["name"] == current_db)
-            return {
-                "status": "success",
-                "current_database": current_db,
-                "instance": f"{self.db_config.get('host', 'localhost')}:{self.db_config.get('port', 5432)}",
-                "count": len(databases),
-                "databases": databases
-            }
-        except Exception as e:
-            logger.error(f"Failed to list databases: {e}")
-            return {"status": "error", "error": str(e)}
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"Failed to list databases: {e}")
+                return {"status": "error", "error": str(e)}
 
     # ==================== Migration Support Methods ====================
 
@@ -1031,408 +1348,391 @@ class GaussDBTools(BaseDatabaseTools):
         result = {
             "status": "success",
             "schema": schema,
-            "mode": "distributed" if self._is_distributed else "centralized",
+            "mode": self._mode,
             "objects": {}
         }
 
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
+        with self._conn(autocommit=True) as conn:
+            try:
+                cur = conn.cursor()
 
-            # Get tables (GaussDB uses pg_tables like PostgreSQL)
-            if "table" in object_types:
-                cur.execute("""
-                    SELECT
-                        t.tablename as name,
-                        t.schemaname as schema,
-                        COALESCE(s.n_live_tup, 0) as row_count,
-                        pg_total_relation_size(t.schemaname||'.'||t.tablename) as size_bytes
-                    FROM pg_tables t
-                    LEFT JOIN pg_stat_user_tables s ON t.schemaname = s.schemaname AND t.tablename = s.relname
-                    WHERE t.schemaname = %s
-                    ORDER BY t.tablename
-                """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["tables"] = [dict(zip(columns, row)) for row in cur.fetchall()]
+                # Get tables (GaussDB uses pg_tables like PostgreSQL)
+                if "table" in object_types:
+                    cur.execute("""
+                        SELECT
+                            t.tablename as name,
+                            t.schemaname as schema,
+                            COALESCE(s.n_live_tup, 0) as row_count,
+                            pg_total_relation_size(t.schemaname||'.'||t.tablename) as size_bytes
+                        FROM pg_tables t
+                        LEFT JOIN pg_stat_user_tables s ON t.schemaname = s.schemaname AND t.tablename = s.relname
+                        WHERE t.schemaname = %s
+                        ORDER BY t.tablename
+                    """, (schema,))
+                    result["objects"]["tables"] = self._rows_to_dicts(cur)
+
+                # Get views
+                if "view" in object_types:
+                    cur.execute("""
+                        SELECT
+                            viewname as name,
+                            schemaname as schema,
+                            definition
+                        FROM pg_views
+                        WHERE schemaname = %s
+                        ORDER BY viewname
+                    """, (schema,))
+                    result["objects"]["views"] = self._rows_to_dicts(cur)
+
+                # Get indexes
+                if "index" in object_types:
+                    cur.execute("""
+                        SELECT
+                            i.indexname as name,
+                            i.tablename as table_name,
+                            i.schemaname as schema,
+                            i.indexdef as definition,
+                            idx.indisunique as is_unique,
+                            idx.indisprimary as is_primary
+                        FROM pg_indexes i
+                        JOIN pg_class c ON c.relname = i.indexname
+                        JOIN pg_index idx ON idx.indexrelid = c.oid
+                        WHERE i.schemaname = %s
+                        ORDER BY i.tablename, i.indexname
+                    """, (schema,))
+                    result["objects"]["indexes"] = self._rows_to_dicts(cur)
+
+                # Get sequences
+                if "sequence" in object_types:
+                    cur.execute("""
+                        SELECT
+                            sequencename as name,
+                            schemaname as schema,
+                            start_value,
+                            min_value,
+                            max_value,
+                            increment_by,
+                            cycle as is_cycle,
+                            cache_size
+                        FROM pg_sequences
+                        WHERE schemaname = %s
+                        ORDER BY sequencename
+                    """, (schema,))
+                    result["objects"]["sequences"] = self._rows_to_dicts(cur)
+
+                # Get functions/procedures
+                if "function" in object_types or "procedure" in object_types:
+                    cur.execute("""
+                        SELECT
+                            p.proname as name,
+                            n.nspname as schema,
+                            CASE p.prokind
+                                WHEN 'f' THEN 'function'
+                                WHEN 'p' THEN 'procedure'
+                                WHEN 'a' THEN 'aggregate'
+                                WHEN 'w' THEN 'window'
+                                ELSE 'function'
+                            END as type,
+                            pg_get_function_arguments(p.oid) as parameters,
+                            pg_get_function_result(p.oid) as return_type,
+                            l.lanname as language
+                        FROM pg_proc p
+                        JOIN pg_namespace n ON p.pronamespace = n.oid
+                        JOIN pg_language l ON p.prolang = l.oid
+                        WHERE n.nspname = %s
+                        ORDER BY p.proname
+                    """, (schema,))
+                    all_routines = self._rows_to_dicts(cur)
+
+                    if "function" in object_types:
+                        result["objects"]["functions"] = [r for r in all_routines if r["type"] == "function"]
+                    if "procedure" in object_types:
+                        result["objects"]["procedures"] = [r for r in all_routines if r["type"] == "procedure"]
+
+                # Get triggers
+                if "trigger" in object_types:
+                    cur.execute("""
+                        SELECT
+                            t.tgname as name,
+                            c.relname as table_name,
+                            n.nspname as schema,
+                            pg_get_triggerdef(t.oid) as definition
+                        FROM pg_trigger t
+                        JOIN pg_class c ON t.tgrelid = c.oid
+                        JOIN pg_namespace n ON c.relnamespace = n.oid
+                        WHERE n.nspname = %s
+                          AND NOT t.tgisinternal
+                        ORDER BY c.relname, t.tgname
+                    """, (schema,))
+                    result["objects"]["triggers"] = self._rows_to_dicts(cur)
+
+                # Get constraints
+                if "constraint" in object_types:
+                    cur.execute("""
+                        SELECT
+                            con.conname as name,
+                            c.relname as table_name,
+                            n.nspname as schema,
+                            CASE con.contype
+                                WHEN 'p' THEN 'PRIMARY KEY'
+                                WHEN 'f' THEN 'FOREIGN KEY'
+                                WHEN 'u' THEN 'UNIQUE'
+                                WHEN 'c' THEN 'CHECK'
+                            END as constraint_type,
+                            pg_get_constraintdef(con.oid) as definition
+                        FROM pg_constraint con
+                        JOIN pg_class c ON con.conrelid = c.oid
+                        JOIN pg_namespace n ON c.relnamespace = n.oid
+                        WHERE n.nspname = %s
+                        ORDER BY c.relname, con.conname
+                    """, (schema,))
+                    result["objects"]["constraints"] = self._rows_to_dicts(cur)
+
+                # Calculate totals
+                total_count = sum(len(result["objects"].get(k, [])) for k in result["objects"])
+                result["total_count"] = total_count
+
+                logger.info(f"Found {total_count} total objects")
+                return result
 
-            # Get views
-            if "view" in object_types:
-                cur.execute("""
-                    SELECT
-                        viewname as name,
-                        schemaname as schema,
-                        definition
-                    FROM pg_views
-                    WHERE schemaname = %s
-                    ORDER BY viewname
-                """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["views"] = [dict(zip(columns, row)) for row in cur.fetchall()]
+            except Exception as e:
+                logger.error(f"Failed to get all objects: {e}")
+                return {"status": "error", "error": str(e)}
 
-            # Get indexes
-            if "index" in object_types:
-                cur.execute("""
-                    SELECT
-                        i.indexname as name,
-                        i.tablename as table_name,
-                        i.schemaname as schema,
-                        i.indexdef as definition,
-                        idx.indisunique as is_unique,
-                        idx.indisprimary as is_primary
-                    FROM pg_indexes i
-                    JOIN pg_class c ON c.relname = i.indexname
-                    JOIN pg_index idx ON idx.indexrelid = c.oid
-                    WHERE i.schemaname = %s
-                    ORDER BY i.tablename, i.indexname
-                """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["indexes"] = [dict(zip(columns, row)) for row in cur.fetchall()]
+    def get_object_ddl(self, object_type: str, object_name: str, schema: str = None) -> Dict[str, Any]:
+        """Get DDL for a specific database object"""
+        schema = schema or "public"
+        logger.info(f"Getting DDL for {object_type}: {schema}.{object_name}")
 
-            # Get sequences
-            if "sequence" in object_types:
-                cur.execute("""
-                    SELECT
-                        sequencename as name,
-                        schemaname as schema,
-                        start_value,
-                        min_value,
-                        max_value,
-                        increment_by,
-                        cycle as is_cycle,
-                        cache_size
-                    FROM pg_sequences
-                    WHERE schemaname = %s
-                    ORDER BY sequencename
-                """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["sequences"] = [dict(zip(columns, row)) for row in cur.fetchall()]
+        with self._conn(autocommit=True) as conn:
+            try:
+                cur = conn.cursor()
+                ddl = None
+                dependencies = []
+
+                if object_type == "table":
+                    # Build table DDL manually
+                    cur.execute("""
+                        SELECT
+                            'CREATE TABLE ' || quote_ident(%s) || '.' || quote_ident(%s) || ' (' ||
+                            string_agg(
+                                quote_ident(column_name) || ' ' ||
+                                data_type ||
+                                CASE
+                                    WHEN character_maximum_length IS NOT NULL
+                                    THEN '(' || character_maximum_length || ')'
+                                    ELSE ''
+                                END ||
+                                CASE WHEN is_nullable = 'NO' THEN ' NOT NULL' ELSE '' END ||
+                                CASE WHEN column_default IS NOT NULL THEN ' DEFAULT ' || column_default ELSE '' END,
+                                ', ' ORDER BY ordinal_position
+                            ) || ');'
+                        FROM information_schema.columns
+                        WHERE table_schema = %s AND table_name = %s
+                    """, (schema, object_name, schema, object_name))
+                    result = cur.fetchone()
+                    ddl = result[0] if result else None
+
+                    # Get FK dependencies
+                    cur.execute("""
+                        SELECT DISTINCT ccu.table_name
+                        FROM information_schema.table_constraints tc
+                        JOIN information_schema.constraint_column_usage ccu
+                            ON ccu.constraint_name = tc.constraint_name
+                        WHERE tc.constraint_type = 'FOREIGN KEY'
+                            AND tc.table_schema = %s
+                            AND tc.table_name = %s
+                    """, (schema, object_name))
+                    dependencies = [{"type": "table", "name": row[0]} for row in cur]
+
+                elif object_type == "view":
+                    cur.execute("""
+                        SELECT 'CREATE OR REPLACE VIEW ' || quote_ident(%s) || '.' || quote_ident(viewname) || ' AS ' || definition
+                        FROM pg_views
+                        WHERE schemaname = %s AND viewname = %s
+                    """, (schema, schema, object_name))
+                    result = cur.fetchone()
+                    ddl = result[0] if result else None
+
+                elif object_type == "index":
+                    cur.execute("""
+                        SELECT indexdef
+                        FROM pg_indexes
+                        WHERE schemaname = %s AND indexname = %s
+                    """, (schema, object_name))
+                    result = cur.fetchone()
+                    ddl = result[0] if result else None
+
+                elif object_type == "sequence":
+                    cur.execute("""
+                        SELECT 'CREATE SEQUENCE ' || quote_ident(%s) || '.' || quote_ident(sequencename) ||
+                               ' START ' || start_value ||
+                               ' INCREMENT ' || increment_by ||
+                               ' MINVALUE ' || min_value ||
+                               ' MAXVALUE ' || max_value ||
+                               CASE WHEN cycle THEN ' CYCLE' ELSE ' NO CYCLE' END ||
+                               ' CACHE ' || cache_size || ';'
+                        FROM pg_sequences
+                        WHERE schemaname = %s AND sequencename = %s
+                    """, (schema, schema, object_name))
+                    result = cur.fetchone()
+                    ddl = result[0] if result else None
+
+                elif object_type in ("function", "procedure"):
+                    cur.execute("""
+                        SELECT pg_get_functiondef(p.oid)
+                        FROM pg_proc p
+                        JOIN pg_namespace n ON p.pronamespace = n.oid
+                        WHERE n.nspname = %s AND p.proname = %s
+                    """, (schema, object_name))
+                    result = cur.fetchone()
+                    ddl = result[0] if result else None
+
+                elif object_type == "trigger":
+                    cur.execute("""
+                        SELECT pg_get_triggerdef(t.oid, true)
+                        FROM pg_trigger t
+                        JOIN pg_class c ON t.tgrelid = c.oid
+                        JOIN pg_namespace n ON c.relnamespace = n.oid
+                        WHERE n.nspname = %s AND t.tgname = %s
+                    """, (schema, object_name))
+                    result = cur.fetchone()
+                    ddl = result[0] if result else None
+
+                if ddl:
+                    return {
+                        "status": "success",
+                        "object_type": object_type,
+                        "object_name": object_name,
+                        "schema": schema,
+                        "ddl": ddl,
+                        "dependencies": dependencies
+                    }
+                else:
+                    return {
+                        "status": "error",
+                        "error": f"Object not found: {object_type} {schema}.{object_name}"
+                    }
 
-            # Get functions/procedures
-            if "function" in object_types or "procedure" in object_types:
-                cur.execute("""
-                    SELECT
-                        p.proname as name,
-                        n.nspname as schema,
-                        CASE p.prokind
-                            WHEN 'f' THEN 'function'
-                            WHEN 'p' THEN 'procedure'
-                            WHEN 'a' THEN 'aggregate'
-                            WHEN 'w' THEN 'window'
-                            ELSE 'function'
-                        END as type,
-                        pg_get_function_arguments(p.oid) as parameters,
-                        pg_get_function_result(p.oid) as return_type,
-                        l.lanname as language
-                    FROM pg_proc p
-                    JOIN pg_namespace n ON p.pronamespace = n.oid
-                    JOIN pg_language l ON p.prolang = l.oid
-                    WHERE n.nspname = %s
-                    ORDER BY p.proname
-                """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                all_routines = [dict(zip(columns, row)) for row in cur.fetchall()]
+            except Exception as e:
+                logger.error(f"Failed to get DDL: {e}")
+                return {"status": "error", "error": str(e)}
 
-                if "function" in object_types:
-                    result["objects"]["functions"] = [r for r in all_routines if r["type"] == "function"]
-                if "procedure" in object_types:
-                    result["objects"]["procedures"] = [r for r in all_routines if r["type"] == "procedure"]
+    def get_object_dependencies(self, schema: str = None) -> Dict[str, Any]:
+        """Get object dependencies in the database"""
+        schema = schema or "public"
+        logger.info(f"Getting object dependencies for schema: {schema}")
 
-            # Get triggers
-            if "trigger" in object_types:
-                cur.execute("""
-                    SELECT
-                        t.tgname as name,
-                        c.relname as table_name,
-                        n.nspname as schema,
-                        pg_get_triggerdef(t.oid) as definition
-                    FROM pg_trigger t
-                    JOIN pg_class c ON t.tgrelid = c.oid
-                    JOIN pg_namespace n ON c.relnamespace = n.oid
-                    WHERE n.nspname = %s
-                      AND NOT t.tgisinternal
-                    ORDER BY c.relname, t.tgname
-                """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["triggers"] = [dict(zip(columns, row)) for row in cur.fetchall()]
+        with self._conn(autocommit=True) as conn:
+            try:
+                cur = conn.cursor()
 
-            # Get constraints
-            if "constraint" in object_types:
+                # Get dependencies from pg_depend (similar to PostgreSQL)
                 cur.execute("""
-                    SELECT
-                        con.conname as name,
-                        c.relname as table_name,
-                        n.nspname as schema,
-                        CASE con.contype
-                            WHEN 'p' THEN 'PRIMARY KEY'
-                            WHEN 'f' THEN 'FOREIGN KEY'
-                            WHEN 'u' THEN 'UNIQUE'
-                            WHEN 'c' THEN 'CHECK'
-                        END as constraint_type,
-                        pg_get_constraintdef(con.oid) as definition
-                    FROM pg_constraint con
-                    JOIN pg_class c ON con.conrelid = c.oid
-                    JOIN pg_namespace n ON c.relnamespace = n.oid
-                    WHERE n.nspname = %s
-                    ORDER BY c.relname, con.conname
-                """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["constraints"] = [dict(zip(columns, row)) for row in cur.fetchall()]
-
-            # Calculate totals
-            total_count = sum(len(result["objects"].get(k, [])) for k in result["objects"])
-            result["total_count"] = total_count
+                    SELECT DISTINCT
+                        CASE dc.relkind
+                            WHEN 'r' THEN 'table'
+                            WHEN 'v' THEN 'view'
+                            WHEN 'i' THEN 'index'
+                            WHEN 'S' THEN 'sequence'
+                            ELSE 'other'
+                        END as object_type,
+                        dc.relname as object_name,
+                        CASE rc.relkind
+                            WHEN 'r' THEN 'table'
+                            WHEN 'v' THEN 'view'
+                            WHEN 'i' THEN 'index'
+                            WHEN 'S' THEN 'sequence'
+                            ELSE 'other'
+                        END as depends_on_type,
+                        rc.relname as depends_on_name
+                    FROM pg_depend d
+                    JOIN pg_class dc ON d.classid = 'pg_class'::regclass AND d.objid = dc.oid
+                    JOIN pg_class rc ON d.refclassid = 'pg_class'::regclass AND d.refobjid = rc.oid
+                    JOIN pg_namespace dn ON dc.relnamespace = dn.oid
+                    JOIN pg_namespace rn ON rc.relnamespace = rn.oid
+                    WHERE dn.nspname = %s
+                      AND rn.nspname = %s
+                      AND d.deptype IN ('n', 'a')
+                      AND dc.relname != rc.relname
+                    ORDER BY dc.relname
+                """, (schema, schema))
+
+                dependencies = self._rows_to_dicts(cur)
+
+                # Build dependency graph
+                dependency_graph = {}
+                for dep in dependencies:
+                    obj_name = dep["object_name"]
+                    dep_name = dep["depends_on_name"]
+                    if obj_name not in dependency_graph:
+                        dependency_graph[obj_name] = []
+                    dependency_graph[obj_name].append(dep_name)
 
-            logger.info(f"Found {total_count} total objects")
-            return result
+                return {
+                    "status": "success",
+                    "schema": schema,
+                    "dependencies": dependencies,
+                    "dependency_graph": dependency_graph
+                }
 
-        except Exception as e:
-            logger.error(f"Failed to get all objects: {e}")
-            return {"status": "error", "error": str(e)}
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"Failed to get dependencies: {e}")
+                return {"status": "error", "error": str(e)}
 
-    def get_object_ddl(self, object_type: str, object_name: str, schema: str = None) -> Dict[str, Any]:
-        """Get DDL for a specific database object"""
+    def get_foreign_key_dependencies(self, schema: str = None) -> Dict[str, Any]:
+        """Get foreign key dependencies between tables"""
         schema = schema or "public"
-        logger.info(f"Getting DDL for {object_type}: {schema}.{object_name}")
+        logger.info(f"Getting FK dependencies for schema: {schema}")
 
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-            ddl = None
-            dependencies = []
+        with self._conn(autocommit=True) as conn:
+            try:
+                cur = conn.cursor()
 
-            if object_type == "table":
-                # Build table DDL manually
                 cur.execute("""
                     SELECT
-                        'CREATE TABLE ' || quote_ident(%s) || '.' || quote_ident(%s) || ' (' ||
-                        string_agg(
-                            quote_ident(column_name) || ' ' ||
-                            data_type ||
-                            CASE
-                                WHEN character_maximum_length IS NOT NULL
-                                THEN '(' || character_maximum_length || ')'
-                                ELSE ''
-                            END ||
-                            CASE WHEN is_nullable = 'NO' THEN ' NOT NULL' ELSE '' END ||
-                            CASE WHEN column_default IS NOT NULL THEN ' DEFAULT ' || column_default ELSE '' END,
-                            ', ' ORDER BY ordinal_position
-                        ) || ');'
-                    FROM information_schema.columns
-                    WHERE table_schema = %s AND table_name = %s
-                """, (schema, object_name, schema, object_name))
-                result = cur.fetchone()
-                ddl = result[0] if result else None
-
-                # Get FK dependencies
-                cur.execute("""
-                    SELECT DISTINCT ccu.table_name
+                        tc.constraint_name,
+                        tc.table_name,
+                        kcu.column_name,
+                        ccu.table_name AS referenced_table,
+                        ccu.column_name AS referenced_column
                     FROM information_schema.table_constraints tc
+                    JOIN information_schema.key_column_usage kcu
+                        ON tc.constraint_name = kcu.constraint_name
+                        AND tc.table_schema = kcu.table_schema
                     JOIN information_schema.constraint_column_usage ccu
                         ON ccu.constraint_name = tc.constraint_name
+                        AND ccu.table_schema = tc.table_schema
                     WHERE tc.constraint_type = 'FOREIGN KEY'
                         AND tc.table_schema = %s
-                        AND tc.table_name = %s
-                """, (schema, object_name))
-                dependencies = [{"type": "table", "name": row[0]} for row in cur.fetchall()]
+                    ORDER BY tc.table_name
+                """, (schema,))
+
+                foreign_keys = self._rows_to_dicts(cur)
+
+                # Build dependency graph for topological sort
+                tables = set()
+                graph = {}
+                for fk in foreign_keys:
+                    tables.add(fk["table_name"])
+                    tables.add(fk["referenced_table"])
+                    if fk["table_name"] not in graph:
+                        graph[fk["table_name"]] = set()
+                    graph[fk["table_name"]].add(fk["referenced_table"])
+
+                # Topological sort
+                table_order = self._topological_sort(tables, graph)
 
-            elif object_type == "view":
-                cur.execute("""
-                    SELECT 'CREATE OR REPLACE VIEW ' || quote_ident(%s) || '.' || quote_ident(viewname) || ' AS ' || definition
-                    FROM pg_views
-                    WHERE schemaname = %s AND viewname = %s
-                """, (schema, schema, object_name))
-                result = cur.fetchone()
-                ddl = result[0] if result else None
-
-            elif object_type == "index":
-                cur.execute("""
-                    SELECT indexdef
-                    FROM pg_indexes
-                    WHERE schemaname = %s AND indexname = %s
-                """, (schema, object_name))
-                result = cur.fetchone()
-                ddl = result[0] if result else None
-
-            elif object_type == "sequence":
-                cur.execute("""
-                    SELECT 'CREATE SEQUENCE ' || quote_ident(%s) || '.' || quote_ident(sequencename) ||
-                           ' START ' || start_value ||
-                           ' INCREMENT ' || increment_by ||
-                           ' MINVALUE ' || min_value ||
-                           ' MAXVALUE ' || max_value ||
-                           CASE WHEN cycle THEN ' CYCLE' ELSE ' NO CYCLE' END ||
-                           ' CACHE ' || cache_size || ';'
-                    FROM pg_sequences
-                    WHERE schemaname = %s AND sequencename = %s
-                """, (schema, schema, object_name))
-                result = cur.fetchone()
-                ddl = result[0] if result else None
-
-            elif object_type in ("function", "procedure"):
-                cur.execute("""
-                    SELECT pg_get_functiondef(p.oid)
-                    FROM pg_proc p
-                    JOIN pg_namespace n ON p.pronamespace = n.oid
-                    WHERE n.nspname = %s AND p.proname = %s
-                """, (schema, object_name))
-                result = cur.fetchone()
-                ddl = result[0] if result else None
-
-            elif object_type == "trigger":
-                cur.execute("""
-                    SELECT pg_get_triggerdef(t.oid, true)
-                    FROM pg_trigger t
-                    JOIN pg_class c ON t.tgrelid = c.oid
-                    JOIN pg_namespace n ON c.relnamespace = n.oid
-                    WHERE n.nspname = %s AND t.tgname = %s
-                """, (schema, object_name))
-                result = cur.fetchone()
-                ddl = result[0] if result else None
-
-            if ddl:
                 return {
                     "status": "success",
-                    "object_type": object_type,
-                    "object_name": object_name,
                     "schema": schema,
-                    "ddl": ddl,
-                    "dependencies": dependencies
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": f"Object not found: {object_type} {schema}.{object_name}"
+                    "foreign_keys": foreign_keys,
+                    "table_order": table_order
                 }
 
-        except Exception as e:
-            logger.error(f"Failed to get DDL: {e}")
-            return {"status": "error", "error": str(e)}
-        finally:
-            conn.close()
-
-    def get_object_dependencies(self, schema: str = None) -> Dict[str, Any]:
-        """Get object dependencies in the database"""
-        schema = schema or "public"
-        logger.info(f"Getting object dependencies for schema: {schema}")
-
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-
-            # Get dependencies from pg_depend (similar to PostgreSQL)
-            cur.execute("""
-                SELECT DISTINCT
-                    CASE dc.relkind
-                        WHEN 'r' THEN 'table'
-                        WHEN 'v' THEN 'view'
-                        WHEN 'i' THEN 'index'
-                        WHEN 'S' THEN 'sequence'
-                        ELSE 'other'
-                    END as object_type,
-                    dc.relname as object_name,
-                    CASE rc.relkind
-                        WHEN 'r' THEN 'table'
-                        WHEN 'v' THEN 'view'
-                        WHEN 'i' THEN 'index'
-                        WHEN 'S' THEN 'sequence'
-                        ELSE 'other'
-                    END as depends_on_type,
-                    rc.relname as depends_on_name
-                FROM pg_depend d
-                JOIN pg_class dc ON d.classid = 'pg_class'::regclass AND d.objid = dc.oid
-                JOIN pg_class rc ON d.refclassid = 'pg_class'::regclass AND d.refobjid = rc.oid
-                JOIN pg_namespace dn ON dc.relnamespace = dn.oid
-                JOIN pg_namespace rn ON rc.relnamespace = rn.oid
-                WHERE dn.nspname = %s
-                  AND rn.nspname = %s
-                  AND d.deptype IN ('n', 'a')
-                  AND dc.relname != rc.relname
-                ORDER BY dc.relname
-            """, (schema, schema))
-
-            columns = [desc[0] for desc in cur.description]
-            dependencies = [dict(zip(columns, row)) for row in cur.fetchall()]
-
-            # Build dependency graph
-            dependency_graph = {}
-            for dep in dependencies:
-                obj_name = dep["object_name"]
-                dep_name = dep["depends_on_name"]
-                if obj_name not in dependency_graph:
-                    dependency_graph[obj_name] = []
-                dependency_graph[obj_name].append(dep_name)
-
-            return {
-                "status": "success",
-                "schema": schema,
-                "dependencies": dependencies,
-                "dependency_graph": dependency_graph
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to get dependencies: {e}")
-            return {"status": "error", "error": str(e)}
-        finally:
-            conn.close()
-
-    def get_foreign_key_dependencies(self, schema: str = None) -> Dict[str, Any]:
-        """Get foreign key dependencies between tables"""
-        schema = schema or "public"
-        logger.info(f"Getting FK dependencies for schema: {schema}")
-
-        conn = self.get_connection()
-        try:
-            cur = conn.cursor()
-
-            cur.execute("""
-                SELECT
-                    tc.constraint_name,
-                    tc.table_name,
-                    kcu.column_name,
-                    ccu.table_name AS referenced_table,
-                    ccu.column_name AS referenced_column
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                    AND tc.table_schema = kcu.table_schema
-                JOIN information_schema.constraint_column_usage ccu
-                    ON ccu.constraint_name = tc.constraint_name
-                    AND ccu.table_schema = tc.table_schema
-                WHERE tc.constraint_type = 'FOREIGN KEY'
-                    AND tc.table_schema = %s
-                ORDER BY tc.table_name
-            """, (schema,))
-
-            columns = [desc[0] for desc in cur.description]
-            foreign_keys = [dict(zip(columns, row)) for row in cur.fetchall()]
-
-            # Build dependency graph for topological sort
-            tables = set()
-            graph = {}
-            for fk in foreign_keys:
-                tables.add(fk["table_name"])
-                tables.add(fk["referenced_table"])
-                if fk["table_name"] not in graph:
-                    graph[fk["table_name"]] = set()
-                graph[fk["table_name"]].add(fk["referenced_table"])
-
-            # Topological sort
-            table_order = self._topological_sort(tables, graph)
-
-            return {
-                "status": "success",
-                "schema": schema,
-                "foreign_keys": foreign_keys,
-                "table_order": table_order
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to get FK dependencies: {e}")
-            return {"status": "error", "error": str(e)}
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"Failed to get FK dependencies: {e}")
+                return {"status": "error", "error": str(e)}
 
     def _topological_sort(self, nodes: set, graph: dict) -> List[str]:
         """Perform topological sort on dependency graph"""
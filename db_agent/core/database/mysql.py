@@ -6,7 +6,7 @@ from typing import Dict, Any, List
 import logging
 import re
 from db_agent.i18n import t
-from .base import BaseDatabaseTools
+from .base import BaseDatabaseTools, DescribeTableResult, ExplainResult, ListTablesResult, QueryResult, SampleDataResult
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,11 @@ logger = logging.getLogger(__name__)
 class MySQLTools(BaseDatabaseTools):
     """MySQL database tools implementation (supports MySQL 5.7 and 8.0)"""
 
+    __slots__ = (
+        "db_config", "db_version", "db_version_num", "db_version_full",
+        "_has_performance_schema"
+    )
+
     def __init__(self, db_config: Dict[str, Any]):
         super().__init__()
         self.db_config = db_config
@@ -225,7 +230,7 @@ class MySQLTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def run_explain(self, sql: str, analyze: bool = False) -> Dict[str, Any]:
+    def run_explain(self, sql: str, analyze: bool = False) -> ExplainResult:
         """
         Run EXPLAIN to analyze query
 
@@ -474,6 +479,7 @@ class MySQLTools(BaseDatabaseTools):
             cur.execute(final_sql)
             conn.commit()
 
+            self._invalidate_perf_cache()
             logger.info("Index created successfully")
 
             return {
@@ -513,6 +519,7 @@ class MySQLTools(BaseDatabaseTools):
             cur.execute(f"ANALYZE TABLE `{schema}`.`{table_name}`")
             result = cur.fetchone()
 
+            self._invalidate_perf_cache()
             logger.info("Statistics updated successfully")
 
             return {
@@ -530,7 +537,7 @@ class MySQLTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def execute_safe_query(self, sql: str) -> Dict[str, Any]:
+    def execute_safe_query(self, sql: str) -> QueryResult:
         """
         Execute safe read-only query
 
@@ -666,6 +673,8 @@ class MySQLTools(BaseDatabaseTools):
             cur.execute(sql)
             rowcount = cur.rowcount
             conn.commit()
+            # DDL or bulk writes may change plans
+            self._invalidate_perf_cache()
             return {
                 "status": "success",
                 "type": "execute",
@@ -684,7 +693,7 @@ class MySQLTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def list_tables(self, schema: str = None) -> Dict[str, Any]:
+    def list_tables(self, schema: str = None) -> ListTablesResult:
         """
         List all tables in the database
 
@@ -731,7 +740,7 @@ class MySQLTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def describe_table(self, table_name: str, schema: str = None) -> Dict[str, Any]:
+    def describe_table(self, table_name: str, schema: str = None) -> DescribeTableResult:
         """
         Get table structure information
 
@@ -809,7 +818,7 @@ class MySQLTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def get_sample_data(self, table_name: str, schema: str = None, limit: int = 10) -> Dict[str, Any]:
+    def get_sample_data(self, table_name: str, schema: str = None, limit: int = 10) -> SampleDataResult:
         """
         Get sample data from a table
 
@@ -7,7 +7,7 @@ import oracledb
 from typing import Dict, Any, List
 import logging
 from db_agent.i18n import t
-from .base import BaseDatabaseTools
+from .base import BaseDatabaseTools, DescribeTableResult, ExplainResult, ListTablesResult, QueryResult, SampleDataResult
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,11 @@ logger = logging.getLogger(__name__)
 class OracleTools(BaseDatabaseTools):
     """Oracle database tools implementation using oracledb Thin mode"""
 
+    __slots__ = (
+        "db_config", "db_version", "db_version_num", "db_version_full",
+        "_default_schema", "_has_dba_views", "_has_sql_monitor", "_has_v_sql"
+    )
+
     def __init__(self, db_config: Dict[str, Any]):
         super().__init__()
         self.db_config = db_config
@@ -130,7 +135,7 @@ class OracleTools(BaseDatabaseTools):
             dsn=dsn
         )
 
-    def list_tables(self, schema: str = None) -> Dict[str, Any]:
+    def list_tables(self, schema: str = None) -> ListTablesResult:
         """
         List all tables in the database
 
@@ -183,7 +188,7 @@ class OracleTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def describe_table(self, table_name: str, schema: str = None) -> Dict[str, Any]:
+    def describe_table(self, table_name: str, schema: str = None) -> DescribeTableResult:
         """
         Get table structure information
 
@@ -271,7 +276,7 @@ class OracleTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def execute_safe_query(self, sql: str) -> Dict[str, Any]:
+    def execute_safe_query(self, sql: str) -> QueryResult:
         """
         Execute safe read-only query
 
@@ -394,6 +399,8 @@ class OracleTools(BaseDatabaseTools):
             cur.execute(sql)
             rowcount = cur.rowcount
             conn.commit()
+            # DDL or bulk writes may change plans
+            self._invalidate_perf_cache()
             return {
                 "status": "success",
                 "type": "execute",
@@ -412,7 +419,7 @@ class OracleTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def run_explain(self, sql: str, analyze: bool = False) -> Dict[str, Any]:
+    def run_explain(self, sql: str, analyze: bool = False) -> ExplainResult:
         """
         Run EXPLAIN PLAN to analyze query
 
@@ -806,6 +813,7 @@ class OracleTools(BaseDatabaseTools):
             cur.execute(index_sql)
             conn.commit()
 
+            self._invalidate_perf_cache()
             logger.info("Index created successfully")
 
             return {
@@ -856,6 +864,7 @@ class OracleTools(BaseDatabaseTools):
             """, {"schema": schema, "table_name": table_name})
             conn.commit()
 
+            self._invalidate_perf_cache()
             logger.info("Statistics updated successfully")
 
             return {
@@ -873,7 +882,7 @@ class OracleTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def get_sample_data(self, table_name: str, schema: str = None, limit: int = 10) -> Dict[str, Any]:
+    def get_sample_data(self, table_name: str, schema: str = None, limit: int = 10) -> SampleDataResult:
         """
         Get sample data from a table
 
@@ -2,54 +2,181 @@
 PostgreSQL Database Tools - PostgreSQL-specific implementation
 """
 import pg8000
-from typing import Dict, Any, List
+from pg8000.native import identifier
+from typing import Dict, Any, Iterator, List, Optional
 import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from db_agent.i18n import t
-from .base import BaseDatabaseTools
+from .base import (
+    BaseDatabaseTools, JSON_TYPE_OID, _parse_explain_json,
+    DescribeTableResult, ExplainResult, ListTablesResult, QueryResult, SampleDataResult
+)
 
 logger = logging.getLogger(__name__)
 
+# Statement classification only needs the leading keyword(s); anchored
+# case-insensitive matches avoid upper-casing the whole SQL text per call.
+_SAFE_QUERY_RE = re.compile(r'\s*(?:SELECT|SHOW|EXPLAIN|WITH)\b', re.IGNORECASE)
+_READONLY_SQL_RE = re.compile(r'\s*(?:SELECT|SHOW|EXPLAIN)\b', re.IGNORECASE)
+_AUTOCOMMIT_SQL_RE = re.compile(r'\s*(?:CREATE\s+DATABASE|DROP\s+DATABASE|VACUUM)\b', re.IGNORECASE)
+# group(1) is set when the statement already says CONCURRENTLY
+_CREATE_INDEX_RE = re.compile(r'\s*CREATE\s+INDEX(\s+CONCURRENTLY)?\b', re.IGNORECASE)
+
+# Catalog row versions (xmin) that together change whenever the DDL produced
+# by get_object_ddl for the object can change
+_DDL_TOKEN_SQL = {
+    "table": """
+        SELECT c.xmin::text
+            || ':' || COALESCE((SELECT string_agg(a.xmin::text, ',' ORDER BY a.attnum)
+                                FROM pg_attribute a WHERE a.attrelid = c.oid AND a.attnum > 0), '')
+            || ':' || COALESCE((SELECT string_agg(d.xmin::text, ',' ORDER BY d.oid)
+                                FROM pg_attrdef d WHERE d.adrelid = c.oid), '')
+            || ':' || COALESCE((SELECT string_agg(con.xmin::text, ',' ORDER BY con.oid)
+                                FROM pg_constraint con WHERE con.conrelid = c.oid), '')
+        FROM pg_class c
+        JOIN pg_namespace n ON c.relnamespace = n.oid
+        WHERE n.nspname = %s AND c.relname = %s AND c.relkind IN ('r', 'p')
+    """,
+    "view": """
+        SELECT c.xmin::text || ':' || COALESCE((SELECT string_agg(r.xmin::text, ',')
+                                                FROM pg_rewrite r WHERE r.ev_class = c.oid), '')
+        FROM pg_class c
+        JOIN pg_namespace n ON c.relnamespace = n.oid
+        WHERE n.nspname = %s AND c.relname = %s AND c.relkind = 'v'
+    """,
+    "index": """
+        SELECT c.xmin::text
+        FROM pg_class c
+        JOIN pg_namespace n ON c.relnamespace = n.oid
+        WHERE n.nspname = %s AND c.relname = %s AND c.relkind = 'i'
+    """,
+    "sequence": """
+        SELECT c.xmin::text || ':' || s.xmin::text
+        FROM pg_class c
+        JOIN pg_namespace n ON c.relnamespace = n.oid
+        JOIN pg_sequence s ON s.seqrelid = c.oid
+        WHERE n.nspname = %s AND c.relname = %s
+    """,
+    "function": """
+        SELECT string_agg(p.xmin::text, ',' ORDER BY p.oid)
+        FROM pg_proc p
+        JOIN pg_namespace n ON p.pronamespace = n.oid
+        WHERE n.nspname = %s AND p.proname = %s
+    """,
+    "trigger": """
+        SELECT string_agg(t.xmin::text, ',' ORDER BY t.oid)
+        FROM pg_trigger t
+        JOIN pg_class c ON t.tgrelid = c.oid
+        JOIN pg_namespace n ON c.relnamespace = n.oid
+        WHERE n.nspname = %s AND t.tgname = %s
+    """,
+}
+_DDL_TOKEN_SQL["procedure"] = _DDL_TOKEN_SQL["function"]
+
+# Upper bound on concurrent connections opened by describe_tables
+_DESCRIBE_MAX_WORKERS = 8
+
+# Plain EXPLAIN results are reused for identical SQL within this window;
+# slightly stale plans are acceptable while iterating on a query.
+_EXPLAIN_CACHE_TTL = 60.0
+_EXPLAIN_CACHE_SIZE = 128
+
+
+def _qualified_name(schema: str, name: str) -> str:
+    """Quote a schema-qualified object name for safe interpolation into SQL"""
+    return f"{identifier(schema)}.{identifier(name)}"
+
 
 class PostgreSQLTools(BaseDatabaseTools):
     """PostgreSQL database tools implementation"""
 
+    __slots__ = (
+        "db_config", "_db_version", "_db_version_num", "_db_version_full",
+        "_db_info_loaded", "_db_info_lock", "_explain_cache", "_explain_cache_lock",
+        "_metadata_local"
+    )
+
     def __init__(self, db_config: Dict[str, Any]):
         super().__init__()
         self.db_config = db_config
-        self.db_version = None
-        self.db_version_num = None
-        self.db_version_full = None
-        self._init_db_info()
-        logger.info(f"PostgreSQL tools initialized: {db_config['host']}:{db_config['database']} (PostgreSQL {self.db_version})")
+        # Version info is loaded on first access (see _ensure_db_info)
+        self._db_version = None
+        self._db_version_num = None
+        self._db_version_full = None
+        self._db_info_loaded = False
+        self._db_info_lock = threading.Lock()
+        # sql -> (timestamp, EXPLAIN result), see run_explain
+        self._explain_cache = OrderedDict()
+        self._explain_cache_lock = threading.Lock()
+        # Connection shared by the migration metadata methods while
+        # get_migration_snapshot is running on this thread
+        self._metadata_local = threading.local()
+        logger.info(f"PostgreSQL tools initialized: {db_config['host']}:{db_config['database']}")
 
     @property
     def db_type(self) -> str:
         return "postgresql"
 
-    def _init_db_info(self):
-        """Initialize database information"""
-        try:
-            conn = self.get_connection()
-            cur = conn.cursor()
+    @property
+    def db_version(self) -> str:
+        self._ensure_db_info()
+        return self._db_version
 
-            # Get version information
-            cur.execute("SELECT version();")
-            self.db_version_full = cur.fetchone()[0]
+    @property
+    def db_version_num(self) -> int:
+        self._ensure_db_info()
+        return self._db_version_num
 
-            # Get version number (e.g., 150004 means 15.4)
-            cur.execute("SHOW server_version_num;")
-            self.db_version_num = int(cur.fetchone()[0])
+    @property
+    def db_version_full(self) -> str:
+        self._ensure_db_info()
+        return self._db_version_full
+
+    def _invalidate_perf_cache(self):
+        """Also drop cached EXPLAIN plans when indexes or statistics change"""
+        super()._invalidate_perf_cache()
+        with self._explain_cache_lock:
+            self._explain_cache.clear()
+
+    def _ensure_db_info(self):
+        """Load version information once, on first use"""
+        if not self._db_info_loaded:
+            with self._db_info_lock:
+                if not self._db_info_loaded:
+                    self._init_db_info()
+                    self._db_info_loaded = True
 
-            # Get short version (e.g., "15.4")
-            cur.execute("SHOW server_version;")
-            self.db_version = cur.fetchone()[0]
+    def _init_db_info(self):
+        """Initialize database information"""
+        try:
+            conn = self.get_connection(autocommit=True)
+            try:
+                cur = conn.cursor()
 
-            conn.close()
+                # Full version string, version number (e.g., 150004 means 15.4)
+                # and short version (e.g., "15.4") in a single round-trip
+                cur.execute("""
+                    SELECT version(),
+                           current_setting('server_version_num'),
+                           current_setting('server_version');
+                """)
+                version_full, version_num, version = cur.fetchone()
+                self._db_version_full = version_full
+                self._db_version_num = int(version_num)
+                self._db_version = version
+            finally:
+                conn.close()
+            logger.info(f"Connected to PostgreSQL {self._db_version}")
         except Exception as e:
             logger.warning(f"Failed to get database version info: {e}")
-            self.db_version = "unknown"
-            self.db_version_num = 0
-            self.db_version_full = "unknown"
+            self._db_version = "unknown"
+            self._db_version_num = 0
+            self._db_version_full = "unknown"
 
     def get_db_info(self) -> Dict[str, Any]:
         """Get database information"""
@@ -62,23 +189,28 @@ class PostgreSQLTools(BaseDatabaseTools):
             "database": self.db_config.get("database")
         }
 
-    def get_connection(self, retries: int = 3):
+    def get_connection(self, retries: int = 3, autocommit: bool = False):
         """Get database connection using pg8000
 
         Args:
             retries: Number of retry attempts for transient failures
+            autocommit: Run statements outside an explicit transaction. Used by
+                        read-only catalog/monitoring helpers so pg8000 does not
+                        issue a separate BEGIN round-trip before the query.
         """
         import time
         last_error = None
         for attempt in range(retries):
             try:
-                return pg8000.connect(
+                conn = pg8000.connect(
                     host=self.db_config.get("host", "localhost"),
                     port=int(self.db_config.get("port", 5432)),
                     database=self.db_config.get("database"),
                     user=self.db_config.get("user"),
                     password=self.db_config.get("password")
                 )
+                conn.autocommit = autocommit
+                return conn
             except Exception as e:
                 last_error = e
                 error_msg = str(e).lower()
@@ -109,7 +241,7 @@ class PostgreSQLTools(BaseDatabaseTools):
         has_pg_stat_statements = False
         pg_stat_version = "new"  # PostgreSQL 13+ uses *_exec_time, older uses *_time
 
-        detect_conn = self.get_connection()
+        detect_conn = self.get_connection(autocommit=True)
         try:
             cur = detect_conn.cursor()
             try:
@@ -135,7 +267,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                 pass
 
         # Now use a fresh connection for the actual query
-        conn = self.get_connection()
+        conn = self.get_connection(autocommit=True)
         try:
             if not has_pg_stat_statements:
                 # Use pg_stat_activity as alternative
@@ -150,12 +282,12 @@ class PostgreSQLTools(BaseDatabaseTools):
                     SELECT
                         query,
                         calls,
-                        ROUND(total_exec_time::numeric, 2) as total_time_ms,
-                        ROUND(mean_exec_time::numeric, 2) as avg_time_ms,
-                        ROUND(max_exec_time::numeric, 2) as max_time_ms,
-                        ROUND(stddev_exec_time::numeric, 2) as stddev_time_ms,
+                        ROUND(total_exec_time::numeric, 2)::float8 as total_time_ms,
+                        ROUND(mean_exec_time::numeric, 2)::float8 as avg_time_ms,
+                        ROUND(max_exec_time::numeric, 2)::float8 as max_time_ms,
+                        ROUND(stddev_exec_time::numeric, 2)::float8 as stddev_time_ms,
                         rows,
-                        ROUND(100.0 * shared_blks_hit / NULLIF(shared_blks_hit + shared_blks_read, 0), 2) as cache_hit_ratio
+                        ROUND(100.0 * shared_blks_hit / NULLIF(shared_blks_hit + shared_blks_read, 0), 2)::float8 as cache_hit_ratio
                     FROM pg_stat_statements
                     WHERE mean_exec_time > %s
                     ORDER BY total_exec_time DESC
@@ -167,12 +299,12 @@ class PostgreSQLTools(BaseDatabaseTools):
                     SELECT
                         query,
                         calls,
-                        ROUND(total_time::numeric, 2) as total_time_ms,
-                        ROUND(mean_time::numeric, 2) as avg_time_ms,
-                        ROUND(max_time::numeric, 2) as max_time_ms,
-                        ROUND(stddev_time::numeric, 2) as stddev_time_ms,
+                        ROUND(total_time::numeric, 2)::float8 as total_time_ms,
+                        ROUND(mean_time::numeric, 2)::float8 as avg_time_ms,
+                        ROUND(max_time::numeric, 2)::float8 as max_time_ms,
+                        ROUND(stddev_time::numeric, 2)::float8 as stddev_time_ms,
                         rows,
-                        ROUND(100.0 * shared_blks_hit / NULLIF(shared_blks_hit + shared_blks_read, 0), 2) as cache_hit_ratio
+                        ROUND(100.0 * shared_blks_hit / NULLIF(shared_blks_hit + shared_blks_read, 0), 2)::float8 as cache_hit_ratio
                     FROM pg_stat_statements
                     WHERE mean_time > %s
                     ORDER BY total_time DESC
@@ -190,8 +322,14 @@ class PostgreSQLTools(BaseDatabaseTools):
                     "summary": {"total_slow_queries": 0, "avg_cache_hit_ratio": 0}
                 }
 
-            columns = [desc[0] for desc in cur.description]
-            results = [dict(zip(columns, row)) for row in cur.fetchall()]
+            # Build rows and accumulate the cache hit ratio in a single pass
+            columns = tuple(desc[0] for desc in cur.description)
+            ratio_index = columns.index("cache_hit_ratio")
+            results = []
+            ratio_sum = 0
+            for row in cur:
+                results.append(dict(zip(columns, row)))
+                ratio_sum += row[ratio_index] or 0
 
             return {
                 "status": "success",
@@ -200,7 +338,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                 "queries": results,
                 "summary": {
                     "total_slow_queries": len(results),
-                    "avg_cache_hit_ratio": sum(q['cache_hit_ratio'] or 0 for q in results) / len(results) if results else 0
+                    "avg_cache_hit_ratio": ratio_sum / len(results) if results else 0
                 }
             }
 
@@ -223,7 +361,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                     datname as database,
                     state,
                     CASE WHEN query_start IS NOT NULL
-                         THEN EXTRACT(EPOCH FROM (now() - query_start))::numeric(10,2)
+                         THEN EXTRACT(EPOCH FROM (now() - query_start))::numeric(10,2)::float8
                          ELSE NULL END as duration_seconds,
                     wait_event_type,
                     wait_event,
@@ -247,8 +385,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                     "queries": []
                 }
 
-            columns = [desc[0] for desc in cur.description]
-            results = [dict(zip(columns, row)) for row in cur.fetchall()]
+            results = self._rows_to_dicts(cur)
 
             return {
                 "status": "success",
@@ -265,7 +402,7 @@ class PostgreSQLTools(BaseDatabaseTools):
 
     def get_running_queries(self) -> Dict[str, Any]:
         """Get currently running queries"""
-        conn = self.get_connection()
+        conn = self.get_connection(autocommit=True)
         try:
             cur = conn.cursor()
             query = """
@@ -275,7 +412,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                     datname as database,
                     state,
                     CASE WHEN query_start IS NOT NULL
-                         THEN EXTRACT(EPOCH FROM (now() - query_start))::numeric(10,2)
+                         THEN EXTRACT(EPOCH FROM (now() - query_start))::numeric(10,2)::float8
                          ELSE NULL END as duration_seconds,
                     wait_event_type,
                     wait_event,
@@ -295,8 +432,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                     "queries": []
                 }
 
-            columns = [desc[0] for desc in cur.description]
-            results = [dict(zip(columns, row)) for row in cur.fetchall()]
+            results = self._rows_to_dicts(cur)
 
             return {
                 "status": "success",
@@ -311,7 +447,7 @@ class PostgreSQLTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def run_explain(self, sql: str, analyze: bool = False) -> Dict[str, Any]:
+    def run_explain(self, sql: str, analyze: bool = False) -> ExplainResult:
         """
         Run EXPLAIN to analyze query
 
@@ -325,8 +461,22 @@ class PostgreSQLTools(BaseDatabaseTools):
         logger.info(f"Running EXPLAIN analysis: analyze={analyze}")
         logger.debug(f"SQL: {sql[:100]}...")
 
-        conn = self.get_connection()
+        # EXPLAIN ANALYZE executes the statement, so only plain plans are cached
+        if not analyze:
+            with self._explain_cache_lock:
+                cached = self._explain_cache.get(sql)
+                if cached is not None and time.monotonic() - cached[0] < _EXPLAIN_CACHE_TTL:
+                    self._explain_cache.move_to_end(sql)
+                else:
+                    cached = None
+            if cached is not None:
+                logger.info("EXPLAIN result served from cache")
+                return dict(cached[1])
+
+        conn = self.get_connection(autocommit=not analyze)
         try:
+            # Decode the json plan column with the faster parser when available
+            conn.register_in_adapter(JSON_TYPE_OID, _parse_explain_json)
             cur = conn.cursor()
 
             # Build EXPLAIN statement
@@ -340,12 +490,20 @@ class PostgreSQLTools(BaseDatabaseTools):
 
             logger.info("EXPLAIN analysis completed")
 
-            return {
+            explain_result = {
                 "status": "success",
                 "explain_output": result,
                 "analyzed": analyze,
                 "sql": sql
             }
+            if not analyze:
+                with self._explain_cache_lock:
+                    self._explain_cache[sql] = (time.monotonic(), explain_result)
+                    self._explain_cache.move_to_end(sql)
+                    if len(self._explain_cache) > _EXPLAIN_CACHE_SIZE:
+                        self._explain_cache.popitem(last=False)
+                explain_result = dict(explain_result)
+            return explain_result
 
         except Exception as e:
             logger.error(f"EXPLAIN analysis failed: {e}")
@@ -370,7 +528,7 @@ class PostgreSQLTools(BaseDatabaseTools):
         """
         logger.info(f"Checking index usage: {schema}.{table_name}")
 
-        conn = self.get_connection()
+        conn = self.get_connection(autocommit=True)
         try:
             cur = conn.cursor()
 
@@ -383,7 +541,8 @@ class PostgreSQLTools(BaseDatabaseTools):
                     s.idx_tup_read,
                     s.idx_tup_fetch,
                     pg_size_pretty(pg_relation_size(i.schemaname||'.'||i.indexname)) as index_size,
-                    pg_relation_size(i.schemaname||'.'||i.indexname) as index_size_bytes
+                    pg_relation_size(i.schemaname||'.'||i.indexname) as index_size_bytes,
+                    (s.idx_scan IS NULL OR s.idx_scan = 0) as is_unused
                 FROM pg_indexes i
                 LEFT JOIN pg_stat_user_indexes s
                     ON i.schemaname = s.schemaname
@@ -393,12 +552,15 @@ class PostgreSQLTools(BaseDatabaseTools):
             """
 
             cur.execute(query, (schema, table_name))
-            columns = [desc[0] for desc in cur.description]
-            indexes = [dict(zip(columns, row)) for row in cur.fetchall()]
+            indexes = self._rows_to_dicts(cur)
 
-            # Analysis
-            unused_indexes = [idx for idx in indexes if idx['idx_scan'] == 0 or idx['idx_scan'] is None]
-            total_size = sum(idx['index_size_bytes'] or 0 for idx in indexes)
+            # Analysis (single pass over the index list)
+            unused_indexes = []
+            total_size = 0
+            for idx in indexes:
+                if idx['is_unused']:
+                    unused_indexes.append(idx)
+                total_size += idx['index_size_bytes'] or 0
 
             logger.info(f"Found {len(indexes)} indexes, {len(unused_indexes)} unused")
 
@@ -437,7 +599,7 @@ class PostgreSQLTools(BaseDatabaseTools):
         """
         logger.info(f"Getting table stats: {schema}.{table_name}")
 
-        conn = self.get_connection()
+        conn = self.get_connection(autocommit=True)
         try:
             cur = conn.cursor()
 
@@ -450,7 +612,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                     pg_size_pretty(pg_indexes_size(schemaname||'.'||relname)) as indexes_size,
                     n_live_tup,
                     n_dead_tup,
-                    ROUND(100.0 * n_dead_tup / NULLIF(n_live_tup + n_dead_tup, 0), 2) as dead_ratio,
+                    ROUND(100.0 * n_dead_tup / NULLIF(n_live_tup + n_dead_tup, 0), 2)::float8 as dead_ratio,
                     last_vacuum,
                     last_autovacuum,
                     last_analyze,
@@ -504,22 +666,23 @@ class PostgreSQLTools(BaseDatabaseTools):
         logger.info(f"SQL: {index_sql}")
 
         # Safety check
-        if not index_sql.strip().upper().startswith("CREATE INDEX"):
+        m = _CREATE_INDEX_RE.match(index_sql)
+        if not m:
             return {
                 "status": "error",
                 "error": t("db_only_create_index")
             }
 
         # Add CONCURRENTLY
-        if concurrent and "CONCURRENTLY" not in index_sql.upper():
-            index_sql = index_sql.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+        if concurrent and not m.group(1):
+            index_sql = f"{index_sql[:m.end()]} CONCURRENTLY{index_sql[m.end():]}"
 
-        conn = self.get_connection()
-        conn.autocommit = True
+        conn = self.get_connection(autocommit=True)
 
         try:
             cur = conn.cursor()
             cur.execute(index_sql)
+            self._invalidate_perf_cache()
 
             logger.info("Index created successfully")
 
@@ -555,8 +718,9 @@ class PostgreSQLTools(BaseDatabaseTools):
         conn = self.get_connection()
         try:
             cur = conn.cursor()
-            cur.execute(f"ANALYZE {schema}.{table_name};")
+            cur.execute(f"ANALYZE {_qualified_name(schema, table_name)};")
             conn.commit()
+            self._invalidate_perf_cache()
 
             logger.info("Statistics updated successfully")
 
@@ -575,7 +739,7 @@ class PostgreSQLTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def execute_safe_query(self, sql: str) -> Dict[str, Any]:
+    def execute_safe_query(self, sql: str) -> QueryResult:
         """
         Execute safe read-only query
 
@@ -590,26 +754,17 @@ class PostgreSQLTools(BaseDatabaseTools):
 
         # Clean up the SQL
         sql = sql.strip()
-        sql_upper = sql.upper()
 
         # Auto-fix: If SQL looks like SELECT columns but missing SELECT keyword, prepend it
-        if not (sql_upper.startswith("SELECT") or
-                sql_upper.startswith("SHOW") or
-                sql_upper.startswith("EXPLAIN") or
-                sql_upper.startswith("WITH")):
+        is_safe = _SAFE_QUERY_RE.match(sql) is not None
+        if not is_safe:
             # Check if it looks like a SELECT expression (contains AS, column aliases, or functions)
-            if " AS " in sql_upper or "(" in sql or "," in sql:
+            if " AS " in sql.upper() or "(" in sql or "," in sql:
                 sql = "SELECT " + sql
-                sql_upper = sql.upper()
+                is_safe = True
                 logger.info(f"Auto-prepended SELECT to query")
 
-        # Safety check - allow read-only statements
-        is_safe = (
-            sql_upper.startswith("SELECT") or
-            sql_upper.startswith("SHOW") or
-            sql_upper.startswith("EXPLAIN") or
-            sql_upper.startswith("WITH")  # CTE queries
-        )
+        # Safety check - allow read-only statements (SELECT, SHOW, EXPLAIN, WITH)
         if not is_safe:
             return {
                 "status": "error",
@@ -617,17 +772,12 @@ class PostgreSQLTools(BaseDatabaseTools):
             }
 
         # Detect SELECT that calls functions/stored procedures
-        func_check = self._check_function_call_in_select(sql_upper)
+        func_check = self._check_function_call_in_select(sql)
         if func_check:
             return func_check
 
-        conn = self.get_connection()
         try:
-            cur = conn.cursor()
-            cur.execute(sql)
-
-            columns = [desc[0] for desc in cur.description] if cur.description else []
-            results = [dict(zip(columns, row)) for row in cur.fetchall()] if columns else []
+            results = self._run_select(sql)
 
             logger.info(f"Query successful, returned {len(results)} rows")
 
@@ -643,6 +793,16 @@ class PostgreSQLTools(BaseDatabaseTools):
                 "status": "error",
                 "error": str(e)
             }
+
+    def _run_select(self, sql: str) -> List[Dict[str, Any]]:
+        """Run a read-only statement and return its rows as dicts.
+        Shared by execute_safe_query and the read-only branch of execute_sql;
+        errors propagate so each caller can shape its own error response."""
+        conn = self.get_connection()
+        try:
+            cur = conn.cursor()
+            cur.execute(sql)
+            return self._rows_to_dicts(cur)
         finally:
             conn.close()
 
@@ -657,23 +817,13 @@ class PostgreSQLTools(BaseDatabaseTools):
         Returns:
             Execution result
         """
-        sql_upper = sql.strip().upper()
-
         # Read-only queries execute directly without confirmation
         # SELECT, SHOW, EXPLAIN are all read-only
-        is_readonly = (
-            sql_upper.startswith("SELECT") or
-            sql_upper.startswith("SHOW") or
-            sql_upper.startswith("EXPLAIN")
-        )
+        is_readonly = _READONLY_SQL_RE.match(sql) is not None
 
         if is_readonly:
-            conn = self.get_connection()
             try:
-                cur = conn.cursor()
-                cur.execute(sql)
-                columns = [desc[0] for desc in cur.description] if cur.description else []
-                results = [dict(zip(columns, row)) for row in cur.fetchall()] if columns else []
+                results = self._run_select(sql)
                 return {
                     "status": "success",
                     "type": "query",
@@ -686,8 +836,6 @@ class PostgreSQLTools(BaseDatabaseTools):
                     "error": str(e),
                     "sql": sql
                 }
-            finally:
-                conn.close()
 
         # Non-read-only operations require confirmation
         if not confirmed:
@@ -698,22 +846,18 @@ class PostgreSQLTools(BaseDatabaseTools):
             }
 
         # Check if SQL requires autocommit (cannot run inside transaction block)
-        needs_autocommit = (
-            sql_upper.startswith("CREATE DATABASE") or
-            sql_upper.startswith("DROP DATABASE") or
-            sql_upper.startswith("VACUUM")
-        )
+        needs_autocommit = _AUTOCOMMIT_SQL_RE.match(sql) is not None
 
         # Confirmed, execute operation
-        conn = self.get_connection()
-        if needs_autocommit:
-            conn.autocommit = True
+        conn = self.get_connection(autocommit=needs_autocommit)
         try:
             cur = conn.cursor()
             cur.execute(sql)
             rowcount = cur.rowcount
             if not needs_autocommit:
                 conn.commit()
+            # DDL or bulk writes may change plans
+            self._invalidate_perf_cache()
             return {
                 "status": "success",
                 "type": "execute",
@@ -733,7 +877,7 @@ class PostgreSQLTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def list_tables(self, schema: str = "public") -> Dict[str, Any]:
+    def list_tables(self, schema: str = "public") -> ListTablesResult:
         """
         List all tables in the database
 
@@ -745,7 +889,7 @@ class PostgreSQLTools(BaseDatabaseTools):
         """
         logger.info(f"Listing tables: schema={schema}")
 
-        conn = self.get_connection()
+        conn = self.get_connection(autocommit=True)
         try:
             cur = conn.cursor()
             cur.execute("""
@@ -758,8 +902,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                 ORDER BY pg_total_relation_size(schemaname||'.'||tablename) DESC;
             """, (schema,))
 
-            columns = [desc[0] for desc in cur.description]
-            tables = [dict(zip(columns, row)) for row in cur.fetchall()]
+            tables = self._rows_to_dicts(cur)
 
             logger.info(f"Found {len(tables)} tables")
 
@@ -779,7 +922,7 @@ class PostgreSQLTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def describe_table(self, table_name: str, schema: str = "public") -> Dict[str, Any]:
+    def describe_table(self, table_name: str, schema: str = "public") -> DescribeTableResult:
         """
         Get table structure information
 
@@ -792,7 +935,7 @@ class PostgreSQLTools(BaseDatabaseTools):
         """
         logger.info(f"Getting table structure: {schema}.{table_name}")
 
-        conn = self.get_connection()
+        conn = self.get_connection(autocommit=True)
         try:
             cur = conn.cursor()
 
@@ -809,8 +952,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                 ORDER BY ordinal_position;
             """, (schema, table_name))
 
-            columns = [desc[0] for desc in cur.description]
-            cols = [dict(zip(columns, row)) for row in cur.fetchall()]
+            cols = self._rows_to_dicts(cur)
 
             # Get primary key information
             cur.execute("""
@@ -818,8 +960,8 @@ class PostgreSQLTools(BaseDatabaseTools):
                 FROM pg_index i
                 JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
                 WHERE i.indrelid = %s::regclass AND i.indisprimary;
-            """, (f"{schema}.{table_name}",))
-            pk_columns = [row[0] for row in cur.fetchall()]
+            """, (_qualified_name(schema, table_name),))
+            pk_columns = [row[0] for row in cur]
 
             # Get foreign key information
             cur.execute("""
@@ -836,8 +978,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                     AND tc.table_schema = %s
                     AND tc.table_name = %s;
             """, (schema, table_name))
-            fk_columns = [desc[0] for desc in cur.description]
-            fks = [dict(zip(fk_columns, row)) for row in cur.fetchall()]
+            fks = self._rows_to_dicts(cur)
 
             logger.info(f"Table structure retrieved: {len(cols)} columns")
 
@@ -858,7 +999,35 @@ class PostgreSQLTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def get_sample_data(self, table_name: str, schema: str = "public", limit: int = 10) -> Dict[str, Any]:
+    def describe_tables(self, table_names: List[str], schema: str = "public") -> Dict[str, Any]:
+        """
+        Get structure information for several tables concurrently
+
+        Each table is described on its own connection from a small thread pool,
+        so N tables cost roughly N / workers round-trip latencies instead of N.
+
+        Args:
+            table_names: Table names
+            schema: Schema name
+
+        Returns:
+            Mapping of table name to its describe_table result
+        """
+        if not table_names:
+            return {"status": "success", "schema": schema, "count": 0, "tables": {}}
+
+        workers = min(_DESCRIBE_MAX_WORKERS, len(table_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda name: self.describe_table(name, schema), table_names))
+
+        return {
+            "status": "success",
+            "schema": schema,
+            "count": len(results),
+            "tables": dict(zip(table_names, results))
+        }
+
+    def get_sample_data(self, table_name: str, schema: str = "public", limit: int = 10) -> SampleDataResult:
         """
         Get sample data from a table
 
@@ -872,13 +1041,13 @@ class PostgreSQLTools(BaseDatabaseTools):
         """
         logger.info(f"Getting sample data: {schema}.{table_name}, limit={limit}")
 
-        conn = self.get_connection()
+        conn = self.get_connection(autocommit=True)
         try:
             cur = conn.cursor()
-            cur.execute(f"SELECT * FROM {schema}.{table_name} LIMIT %s;", (limit,))
+            cur.execute(f"SELECT * FROM {_qualified_name(schema, table_name)} LIMIT %s;", (limit,))
 
             columns = [desc[0] for desc in cur.description]
-            rows = [dict(zip(columns, row)) for row in cur.fetchall()]
+            rows = [dict(zip(columns, row)) for row in cur]
 
             logger.info(f"Sample data retrieved: {len(rows)} rows")
 
@@ -899,9 +1068,57 @@ class PostgreSQLTools(BaseDatabaseTools):
         finally:
             conn.close()
 
+    def iter_sample_data(self, table_name: str, schema: str = "public", limit: int = 10,
+                         batch: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over sample rows of a table
+
+        Limits above `batch` are read through a server-side cursor with
+        FETCH FORWARD, so at most `batch` rows are held in memory at once.
+        Smaller limits use a single plain query.
+
+        Args:
+            table_name: Table name
+            schema: Schema name
+            limit: Number of rows to return
+            batch: Rows fetched per round-trip
+
+        Yields:
+            Row dicts
+        """
+        query = f"SELECT * FROM {_qualified_name(schema, table_name)} LIMIT {int(limit)}"
+
+        if limit <= batch:
+            conn = self.get_connection(autocommit=True)
+            try:
+                cur = conn.cursor()
+                cur.execute(query)
+                yield from self._rows_to_dicts(cur)
+            finally:
+                conn.close()
+            return
+
+        # DECLARE needs a transaction; it is read-only and rolled back on close
+        conn = self.get_connection()
+        try:
+            cur = conn.cursor()
+            cur.execute(f"DECLARE sample_cursor NO SCROLL CURSOR FOR {query}")
+            fetch_sql = f"FETCH FORWARD {int(batch)} FROM sample_cursor"
+            while True:
+                cur.execute(fetch_sql)
+                rows = self._rows_to_dicts(cur)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            try:
+                conn.rollback()
+            finally:
+                conn.close()
+
     def list_databases(self) -> Dict[str, Any]:
         """List all databases on the PostgreSQL server instance"""
-        conn = self.get_connection()
+        conn = self.get_connection(autocommit=True)
         try:
             cur = conn.cursor()
             cur.execute("""
@@ -912,8 +1129,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                 WHERE datistemplate = false
                 ORDER BY datname
             """)
-            columns = [desc[0] for desc in cur.description]
-            databases = [dict(zip(columns, row)) for row in cur.fetchall()]
+            databases = self._rows_to_dicts(cur)
             current_db = self.db_config.get("database", "")
             for db in databases:
                 db["is_current"] = (db["name"] == current_db)
@@ -932,6 +1148,36 @@ class PostgreSQLTools(BaseDatabaseTools):
 
     # ==================== Migration Support Methods ====================
 
+    @contextmanager
+    def metadata_session(self):
+        """Share one connection between metadata calls made on this thread"""
+        if getattr(self._metadata_local, "conn", None) is not None:
+            # Nested inside a running session; keep using its connection
+            yield
+            return
+        conn = self.get_connection(autocommit=True)
+        self._metadata_local.conn = conn
+        try:
+            yield
+        finally:
+            self._metadata_local.conn = None
+            conn.close()
+
+    def get_migration_snapshot(self, schema: str = None, object_types: List[str] = None) -> Dict[str, Any]:
+        """Collect objects and dependencies for migration over a single connection"""
+        with self.metadata_session():
+            return super().get_migration_snapshot(schema=schema, object_types=object_types)
+
+    def _acquire_metadata_connection(self):
+        """Return the metadata session's shared connection, or open a new one"""
+        conn = getattr(self._metadata_local, "conn", None)
+        return conn if conn is not None else self.get_connection(autocommit=True)
+
+    def _release_metadata_connection(self, conn):
+        """Close conn unless it belongs to a running metadata session"""
+        if conn is not getattr(self._metadata_local, "conn", None):
+            conn.close()
+
     def get_all_objects(self, schema: str = None, object_types: List[str] = None) -> Dict[str, Any]:
         """Get all database objects for migration"""
         schema = schema or "public"
@@ -946,7 +1192,7 @@ class PostgreSQLTools(BaseDatabaseTools):
             "objects": {}
         }
 
-        conn = self.get_connection()
+        conn = self._acquire_metadata_connection()
         try:
             cur = conn.cursor()
 
@@ -964,8 +1210,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                     WHERE t.schemaname = %s
                     ORDER BY t.tablename
                 """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["tables"] = [dict(zip(columns, row)) for row in cur.fetchall()]
+                result["objects"]["tables"] = self._rows_to_dicts(cur)
 
             # Get views
             if "view" in object_types:
@@ -978,8 +1223,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                     WHERE schemaname = %s
                     ORDER BY viewname
                 """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["views"] = [dict(zip(columns, row)) for row in cur.fetchall()]
+                result["objects"]["views"] = self._rows_to_dicts(cur)
 
             # Get indexes
             if "index" in object_types:
@@ -997,8 +1241,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                     WHERE i.schemaname = %s
                     ORDER BY i.tablename, i.indexname
                 """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["indexes"] = [dict(zip(columns, row)) for row in cur.fetchall()]
+                result["objects"]["indexes"] = self._rows_to_dicts(cur)
 
             # Get sequences
             if "sequence" in object_types:
@@ -1016,8 +1259,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                     WHERE schemaname = %s
                     ORDER BY sequencename
                 """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["sequences"] = [dict(zip(columns, row)) for row in cur.fetchall()]
+                result["objects"]["sequences"] = self._rows_to_dicts(cur)
 
             # Get functions and procedures
             if "function" in object_types or "procedure" in object_types:
@@ -1042,8 +1284,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                       AND p.prokind IN ('f', 'p')
                     ORDER BY p.proname
                 """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                all_routines = [dict(zip(columns, row)) for row in cur.fetchall()]
+                all_routines = self._rows_to_dicts(cur)
 
                 if "function" in object_types:
                     result["objects"]["functions"] = [r for r in all_routines if r["type"] == "function"]
@@ -1076,8 +1317,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                       AND NOT t.tgisinternal
                     ORDER BY c.relname, t.tgname
                 """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["triggers"] = [dict(zip(columns, row)) for row in cur.fetchall()]
+                result["objects"]["triggers"] = self._rows_to_dicts(cur)
 
             # Get constraints
             if "constraint" in object_types:
@@ -1100,8 +1340,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                     WHERE n.nspname = %s
                     ORDER BY c.relname, con.conname
                 """, (schema,))
-                columns = [desc[0] for desc in cur.description]
-                result["objects"]["constraints"] = [dict(zip(columns, row)) for row in cur.fetchall()]
+                result["objects"]["constraints"] = self._rows_to_dicts(cur)
 
             # Calculate totals
             total_count = sum(len(result["objects"].get(k, [])) for k in result["objects"])
@@ -1114,14 +1353,14 @@ class PostgreSQLTools(BaseDatabaseTools):
             logger.error(f"Failed to get all objects: {e}")
             return {"status": "error", "error": str(e)}
         finally:
-            conn.close()
+            self._release_metadata_connection(conn)
 
     def get_object_ddl(self, object_type: str, object_name: str, schema: str = None) -> Dict[str, Any]:
         """Get DDL for a specific database object"""
         schema = schema or "public"
         logger.info(f"Getting DDL for {object_type}: {schema}.{object_name}")
 
-        conn = self.get_connection()
+        conn = self._acquire_metadata_connection()
         try:
             cur = conn.cursor()
             ddl = None
@@ -1162,7 +1401,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                         AND tc.table_schema = %s
                         AND tc.table_name = %s
                 """, (schema, object_name))
-                dependencies = [{"type": "table", "name": row[0]} for row in cur.fetchall()]
+                dependencies = [{"type": "table", "name": row[0]} for row in cur]
 
             elif object_type == "view":
                 cur.execute("""
@@ -1237,14 +1476,29 @@ class PostgreSQLTools(BaseDatabaseTools):
             logger.error(f"Failed to get DDL: {e}")
             return {"status": "error", "error": str(e)}
         finally:
-            conn.close()
+            self._release_metadata_connection(conn)
+
+    def _ddl_version_token(self, object_type: str, object_name: str, schema: str) -> Optional[str]:
+        """Derive the DDL cache token from the catalog rows' xmin values"""
+        token_sql = _DDL_TOKEN_SQL.get(object_type)
+        if token_sql is None:
+            return None
+
+        conn = self._acquire_metadata_connection()
+        try:
+            cur = conn.cursor()
+            cur.execute(token_sql, (schema or "public", object_name))
+            row = cur.fetchone()
+            return row[0] if row else None
+        finally:
+            self._release_metadata_connection(conn)
 
     def get_object_dependencies(self, schema: str = None) -> Dict[str, Any]:
         """Get object dependencies in the database"""
         schema = schema or "public"
         logger.info(f"Getting object dependencies for schema: {schema}")
 
-        conn = self.get_connection()
+        conn = self._acquire_metadata_connection()
         try:
             cur = conn.cursor()
 
@@ -1279,8 +1533,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                 ORDER BY dc.relname
             """, (schema, schema))
 
-            columns = [desc[0] for desc in cur.description]
-            dependencies = [dict(zip(columns, row)) for row in cur.fetchall()]
+            dependencies = self._rows_to_dicts(cur)
 
             # Build dependency graph
             dependency_graph = {}
@@ -1302,14 +1555,14 @@ class PostgreSQLTools(BaseDatabaseTools):
             logger.error(f"Failed to get dependencies: {e}")
             return {"status": "error", "error": str(e)}
         finally:
-            conn.close()
+            self._release_metadata_connection(conn)
 
     def get_foreign_key_dependencies(self, schema: str = None) -> Dict[str, Any]:
         """Get foreign key dependencies between tables"""
         schema = schema or "public"
         logger.info(f"Getting FK dependencies for schema: {schema}")
 
-        conn = self.get_connection()
+        conn = self._acquire_metadata_connection()
         try:
             cur = conn.cursor()
 
@@ -1332,8 +1585,7 @@ class PostgreSQLTools(BaseDatabaseTools):
                 ORDER BY tc.table_name
             """, (schema,))
 
-            columns = [desc[0] for desc in cur.description]
-            foreign_keys = [dict(zip(columns, row)) for row in cur.fetchall()]
+            foreign_keys = self._rows_to_dicts(cur)
 
             # Build dependency graph for topological sort
             tables = set()
@@ -1359,7 +1611,7 @@ class PostgreSQLTools(BaseDatabaseTools):
             logger.error(f"Failed to get FK dependencies: {e}")
             return {"status": "error", "error": str(e)}
         finally:
-            conn.close()
+            self._release_metadata_connection(conn)
 
     def _topological_sort(self, nodes: set, graph: dict) -> List[str]:
         """Perform topological sort on dependency graph"""
@@ -12,7 +12,7 @@ import pytds
 from typing import Dict, Any, List
 import logging
 from db_agent.i18n import t
-from .base import BaseDatabaseTools
+from .base import BaseDatabaseTools, DescribeTableResult, ExplainResult, ListTablesResult, QueryResult, SampleDataResult
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +20,13 @@ logger = logging.getLogger(__name__)
 class SQLServerTools(BaseDatabaseTools):
     """SQL Server database tools implementation using pytds (python-tds)"""
 
+    __slots__ = (
+        "db_config", "_default_schema", "db_version", "db_version_full",
+        "db_version_major", "db_version_minor", "_edition", "_engine_edition",
+        "_is_azure", "_has_dm_exec_query_stats", "_has_query_store",
+        "_has_server_state", "_has_showplan"
+    )
+
     def __init__(self, db_config: Dict[str, Any]):
         super().__init__()
         self.db_config = db_config
@@ -160,7 +167,7 @@ class SQLServerTools(BaseDatabaseTools):
             autocommit=False
         )
 
-    def list_tables(self, schema: str = None) -> Dict[str, Any]:
+    def list_tables(self, schema: str = None) -> ListTablesResult:
         """
         List all tables in the database
 
@@ -215,7 +222,7 @@ class SQLServerTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def describe_table(self, table_name: str, schema: str = None) -> Dict[str, Any]:
+    def describe_table(self, table_name: str, schema: str = None) -> DescribeTableResult:
         """
         Get table structure information
 
@@ -307,7 +314,7 @@ class SQLServerTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def execute_safe_query(self, sql: str) -> Dict[str, Any]:
+    def execute_safe_query(self, sql: str) -> QueryResult:
         """
         Execute safe read-only query
 
@@ -433,6 +440,8 @@ class SQLServerTools(BaseDatabaseTools):
             cur.execute(sql)
             rowcount = cur.rowcount
             conn.commit()
+            # DDL or bulk writes may change plans
+            self._invalidate_perf_cache()
             return {
                 "status": "success",
                 "type": "execute",
@@ -451,7 +460,7 @@ class SQLServerTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def run_explain(self, sql: str, analyze: bool = False) -> Dict[str, Any]:
+    def run_explain(self, sql: str, analyze: bool = False) -> ExplainResult:
         """
         Run execution plan analysis
 
@@ -917,6 +926,7 @@ class SQLServerTools(BaseDatabaseTools):
             cur.execute(index_sql)
             conn.commit()
 
+            self._invalidate_perf_cache()
             logger.info("Index created successfully")
 
             return {
@@ -959,6 +969,7 @@ class SQLServerTools(BaseDatabaseTools):
             cur.execute(sql)
             conn.commit()
 
+            self._invalidate_perf_cache()
             logger.info("Statistics updated successfully")
 
             return {
@@ -976,7 +987,7 @@ class SQLServerTools(BaseDatabaseTools):
         finally:
             conn.close()
 
-    def get_sample_data(self, table_name: str, schema: str = None, limit: int = 10) -> Dict[str, Any]:
+    def get_sample_data(self, table_name: str, schema: str = None, limit: int = 10) -> SampleDataResult:
         """
         Get sample data from a table
 
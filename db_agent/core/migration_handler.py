@@ -48,18 +48,16 @@ class MigrationHandler:
                 "user": source_conn.username,
                 "password": password
             }
-            source_tools = DatabaseToolsFactory.create(source_conn.db_type, source_config)
-
-            # Get all objects
-            objects_result = source_tools.get_all_objects(schema=schema, object_types=object_types)
-            if objects_result.get("status") == "error":
-                return objects_result
 
-            # Get FK dependencies for table ordering
-            fk_deps = source_tools.get_foreign_key_dependencies(schema=schema)
+            # Get all objects plus FK (table ordering) and object dependencies
+            with DatabaseToolsFactory.create(source_conn.db_type, source_config) as source_tools:
+                snapshot = source_tools.get_migration_snapshot(schema=schema, object_types=object_types)
+            if snapshot.get("status") == "error":
+                return snapshot
 
-            # Get object dependencies
-            obj_deps = source_tools.get_object_dependencies(schema=schema)
+            objects_result = snapshot["objects"]
+            fk_deps = snapshot["foreign_keys"]
+            obj_deps = snapshot["dependencies"]
 
             return {
                 "status": "success",
@@ -109,59 +107,137 @@ class MigrationHandler:
             }
             source_tools = DatabaseToolsFactory.create(source_conn.db_type, source_config)
 
-            # Get objects and dependencies
-            objects_result = source_tools.get_all_objects(schema=task.source_schema)
-            fk_deps = source_tools.get_foreign_key_dependencies(schema=task.source_schema)
-
-            if objects_result.get("status") == "error":
-                return objects_result
-
-            objects = objects_result.get("objects", {})
-            table_order = fk_deps.get("table_order", []) if fk_deps.get("status") == "success" else []
-
-            # Build migration items
-            items = []
-            execution_order = 0
-
-            # 1. Sequences first
-            for seq in objects.get("sequences", []):
-                execution_order += 1
-                ddl_result = source_tools.get_object_ddl("sequence", seq["name"], task.source_schema)
-                items.append(MigrationItem(
-                    id=None,
-                    task_id=task_id,
-                    object_type="sequence",
-                    object_name=seq["name"],
-                    schema_name=task.source_schema,
-                    execution_order=execution_order,
-                    depends_on=None,
-                    status="pending",
-                    source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
-                    target_ddl=None,  # Will be converted later
-                    conversion_notes=None,
-                    execution_result=None,
-                    error_message=None,
-                    retry_count=0,
-                    executed_at=None,
-                    created_at=None,
-                    updated_at=None
-                ))
-
-            # 2. Tables in dependency order
-            tables_added = set()
-            for table_name in table_order:
-                if table_name not in tables_added:
+            # Catalog reads and DDL lookups share one source connection,
+            # released together with the source tools
+            with source_tools, source_tools.metadata_session():
+                # Get objects and dependencies
+                objects_result = source_tools.get_all_objects(schema=task.source_schema)
+                fk_deps = source_tools.get_foreign_key_dependencies(schema=task.source_schema)
+
+                if objects_result.get("status") == "error":
+                    return objects_result
+
+                objects = objects_result.get("objects", {})
+                table_order = fk_deps.get("table_order", []) if fk_deps.get("status") == "success" else []
+
+                # Build migration items
+                items = []
+                execution_order = 0
+
+                # 1. Sequences first
+                for seq in objects.get("sequences", []):
+                    execution_order += 1
+                    ddl_result = source_tools.get_object_ddl_cached("sequence", seq["name"], task.source_schema)
+                    items.append(MigrationItem(
+                        id=None,
+                        task_id=task_id,
+                        object_type="sequence",
+                        object_name=seq["name"],
+                        schema_name=task.source_schema,
+                        execution_order=execution_order,
+                        depends_on=None,
+                        status="pending",
+                        source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
+                        target_ddl=None,  # Will be converted later
+                        conversion_notes=None,
+                        execution_result=None,
+                        error_message=None,
+                        retry_count=0,
+                        executed_at=None,
+                        created_at=None,
+                        updated_at=None
+                    ))
+
+                # 2. Tables in dependency order
+                tables_added = set()
+                for table_name in table_order:
+                    if table_name not in tables_added:
+                        execution_order += 1
+                        ddl_result = source_tools.get_object_ddl_cached("table", table_name, task.source_schema)
+                        deps = ddl_result.get("dependencies", []) if ddl_result.get("status") == "success" else []
+                        items.append(MigrationItem(
+                            id=None,
+                            task_id=task_id,
+                            object_type="table",
+                            object_name=table_name,
+                            schema_name=task.source_schema,
+                            execution_order=execution_order,
+                            depends_on=json.dumps([d["name"] for d in deps]) if deps else None,
+                            status="pending",
+                            source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
+                            target_ddl=None,
+                            conversion_notes=None,
+                            execution_result=None,
+                            error_message=None,
+                            retry_count=0,
+                            executed_at=None,
+                            created_at=None,
+                            updated_at=None
+                        ))
+                        tables_added.add(table_name)
+
+                # Add remaining tables not in FK dependency list
+                for table in objects.get("tables", []):
+                    if table["name"] not in tables_added:
+                        execution_order += 1
+                        ddl_result = source_tools.get_object_ddl_cached("table", table["name"], task.source_schema)
+                        items.append(MigrationItem(
+                            id=None,
+                            task_id=task_id,
+                            object_type="table",
+                            object_name=table["name"],
+                            schema_name=task.source_schema,
+                            execution_order=execution_order,
+                            depends_on=None,
+                            status="pending",
+                            source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
+                            target_ddl=None,
+                            conversion_notes=None,
+                            execution_result=None,
+                            error_message=None,
+                            retry_count=0,
+                            executed_at=None,
+                            created_at=None,
+                            updated_at=None
+                        ))
+
+                # 3. Indexes (excluding primary keys which are created with tables)
+                for idx in objects.get("indexes", []):
+                    if not idx.get("is_primary"):
+                        execution_order += 1
+                        ddl_result = source_tools.get_object_ddl_cached("index", idx["name"], task.source_schema)
+                        items.append(MigrationItem(
+                            id=None,
+                            task_id=task_id,
+                            object_type="index",
+                            object_name=idx["name"],
+                            schema_name=task.source_schema,
+                            execution_order=execution_order,
+                            depends_on=json.dumps([idx.get("table_name")]) if idx.get("table_name") else None,
+                            status="pending",
+                            source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
+                            target_ddl=None,
+                            conversion_notes=None,
+                            execution_result=None,
+                            error_message=None,
+                            retry_count=0,
+                            executed_at=None,
+                            created_at=None,
+                            updated_at=None
+                        ))
+
+                # 4. Views
+                for view in objects.get("views", []):
                     execution_order += 1
-                    ddl_result = source_tools.get_object_ddl("table", table_name, task.source_schema)
-                    deps = ddl_result.get("dependencies", []) if ddl_result.get("status") == "success" else []
+                    ddl_result = source_tools.get_object_ddl_cached("view", view["name"], task.source_schema)
                     items.append(MigrationItem(
                         id=None,
                         task_id=task_id,
-                        object_type="table",
-                        object_name=table_name,
+                        object_type="view",
+                        object_name=view["name"],
                         schema_name=task.source_schema,
                         execution_order=execution_order,
-                        depends_on=json.dumps([d["name"] for d in deps]) if deps else None,
+                        depends_on=None,
                         status="pending",
                         source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
                         target_ddl=None,
@@ -173,18 +249,16 @@ class MigrationHandler:
                         created_at=None,
                         updated_at=None
                     ))
-                    tables_added.add(table_name)
 
-            # Add remaining tables not in FK dependency list
-            for table in objects.get("tables", []):
-                if table["name"] not in tables_added:
+                # 5. Functions
+                for func in objects.get("functions", []):
                     execution_order += 1
-                    ddl_result = source_tools.get_object_ddl("table", table["name"], task.source_schema)
+                    ddl_result = source_tools.get_object_ddl_cached("function", func["name"], task.source_schema)
                     items.append(MigrationItem(
                         id=None,
                         task_id=task_id,
-                        object_type="table",
-                        object_name=table["name"],
+                        object_type="function",
+                        object_name=func["name"],
                         schema_name=task.source_schema,
                         execution_order=execution_order,
                         depends_on=None,
@@ -200,19 +274,18 @@ class MigrationHandler:
                         updated_at=None
                     ))
 
-            # 3. Indexes (excluding primary keys which are created with tables)
-            for idx in objects.get("indexes", []):
-                if not idx.get("is_primary"):
+                # 6. Procedures
+                for proc in objects.get("procedures", []):
                     execution_order += 1
-                    ddl_result = source_tools.get_object_ddl("index", idx["name"], task.source_schema)
+                    ddl_result = source_tools.get_object_ddl_cached("procedure", proc["name"], task.source_schema)
                     items.append(MigrationItem(
                         id=None,
                         task_id=task_id,
-                        object_type="index",
-                        object_name=idx["name"],
+                        object_type="procedure",
+                        object_name=proc["name"],
                         schema_name=task.source_schema,
                         execution_order=execution_order,
-                        depends_on=json.dumps([idx.get("table_name")]) if idx.get("table_name") else None,
+                        depends_on=None,
                         status="pending",
                         source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
                         target_ddl=None,
@@ -225,101 +298,29 @@ class MigrationHandler:
                         updated_at=None
                     ))
 
-            # 4. Views
-            for view in objects.get("views", []):
-                execution_order += 1
-                ddl_result = source_tools.get_object_ddl("view", view["name"], task.source_schema)
-                items.append(MigrationItem(
-                    id=None,
-                    task_id=task_id,
-                    object_type="view",
-                    object_name=view["name"],
-                    schema_name=task.source_schema,
-                    execution_order=execution_order,
-                    depends_on=None,
-                    status="pending",
-                    source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
-                    target_ddl=None,
-                    conversion_notes=None,
-                    execution_result=None,
-                    error_message=None,
-                    retry_count=0,
-                    executed_at=None,
-                    created_at=None,
-                    updated_at=None
-                ))
-
-            # 5. Functions
-            for func in objects.get("functions", []):
-                execution_order += 1
-                ddl_result = source_tools.get_object_ddl("function", func["name"], task.source_schema)
-                items.append(MigrationItem(
-                    id=None,
-                    task_id=task_id,
-                    object_type="function",
-                    object_name=func["name"],
-                    schema_name=task.source_schema,
-                    execution_order=execution_order,
-                    depends_on=None,
-                    status="pending",
-                    source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
-                    target_ddl=None,
-                    conversion_notes=None,
-                    execution_result=None,
-                    error_message=None,
-                    retry_count=0,
-                    executed_at=None,
-                    created_at=None,
-                    updated_at=None
-                ))
-
-            # 6. Procedures
-            for proc in objects.get("procedures", []):
-                execution_order += 1
-                ddl_result = source_tools.get_object_ddl("procedure", proc["name"], task.source_schema)
-                items.append(MigrationItem(
-                    id=None,
-                    task_id=task_id,
-                    object_type="procedure",
-                    object_name=proc["name"],
-                    schema_name=task.source_schema,
-                    execution_order=execution_order,
-                    depends_on=None,
-                    status="pending",
-                    source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
-                    target_ddl=None,
-                    conversion_notes=None,
-                    execution_result=None,
-                    error_message=None,
-                    retry_count=0,
-                    executed_at=None,
-                    created_at=None,
-                    updated_at=None
-                ))
-
-            # 7. Triggers
-            for trigger in objects.get("triggers", []):
-                execution_order += 1
-                ddl_result = source_tools.get_object_ddl("trigger", trigger["name"], task.source_schema)
-                items.append(MigrationItem(
-                    id=None,
-                    task_id=task_id,
-                    object_type="trigger",
-                    object_name=trigger["name"],
-                    schema_name=task.source_schema,
-                    execution_order=execution_order,
-                    depends_on=json.dumps([trigger.get("table_name")]) if trigger.get("table_name") else None,
-                    status="pending",
-                    source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
-                    target_ddl=None,
-                    conversion_notes=None,
-                    execution_result=None,
-                    error_message=None,
-                    retry_count=0,
-                    executed_at=None,
-                    created_at=None,
-                    updated_at=None
-                ))
+                # 7. Triggers
+                for trigger in objects.get("triggers", []):
+                    execution_order += 1
+                    ddl_result = source_tools.get_object_ddl_cached("trigger", trigger["name"], task.source_schema)
+                    items.append(MigrationItem(
+                        id=None,
+                        task_id=task_id,
+                        object_type="trigger",
+                        object_name=trigger["name"],
+                        schema_name=task.source_schema,
+                        execution_order=execution_order,
+                        depends_on=json.dumps([trigger.get("table_name")]) if trigger.get("table_name") else None,
+                        status="pending",
+                        source_ddl=ddl_result.get("ddl") if ddl_result.get("status") == "success" else None,
+                        target_ddl=None,
+                        conversion_notes=None,
+                        execution_result=None,
+                        error_message=None,
+                        retry_count=0,
+                        executed_at=None,
+                        created_at=None,
+                        updated_at=None
+                    ))
 
             # Save items to database
             if items:
@@ -706,10 +707,10 @@ class MigrationHandler:
                 "user": source_conn.username,
                 "password": source_password
             }
-            source_tools = DatabaseToolsFactory.create(source_conn.db_type, source_config)
 
             # Get objects from both databases
-            source_objects = source_tools.get_all_objects(schema=task.source_schema)
+            with DatabaseToolsFactory.create(source_conn.db_type, source_config) as source_tools:
+                source_objects = source_tools.get_all_objects(schema=task.source_schema)
             target_objects = self.db_tools.get_all_objects(schema=task.target_schema)
 
             # Compare
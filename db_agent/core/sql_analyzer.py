@@ -3,9 +3,66 @@ SQL Analyzer - SQL性能分析器
 用于在执行分析类查询前检查SQL性能问题
 """
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 from enum import Enum
 
+# 字符串与数字字面量替换为占位符，仅字面量不同的SQL得到相同签名
+_LITERAL_RE = re.compile(r"'[^']*'|\b\d+\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# 分类缓存容量（精确匹配与归一化签名各一份）
+_CLASSIFY_CACHE_SIZE = 1024
+
+
+def normalize_sql(sql: str) -> str:
+    """将SQL归一化为去除字面量、合并空白并小写的签名"""
+    return _WHITESPACE_RE.sub(" ", _LITERAL_RE.sub("?", sql)).strip().lower()
+
+
+def _json_plan_root(plan: Any) -> Any:
+    """返回 EXPLAIN (FORMAT JSON) 结果中的根计划节点，不是JSON计划时返回None"""
+    if isinstance(plan, list):
+        plan = plan[0] if plan else None
+    if isinstance(plan, dict):
+        return plan.get("Plan")
+    return None
+
+
+def _flatten_plan_tree(root: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """
+    将JSON计划树按先序遍历展开为列式数组
+
+    使用显式栈迭代遍历，避免深层计划的递归开销；后续检查只需扫描这几个列表。
+
+    Returns:
+        {"node_types": [...], "relations": [...], "total_costs": [...], "plan_rows": [...]}
+    """
+    node_types = []
+    relations = []
+    total_costs = []
+    plan_rows = []
+
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        node_types.append(node.get("Node Type"))
+        relations.append(node.get("Relation Name"))
+        total_costs.append(node.get("Total Cost"))
+        plan_rows.append(int(node.get("Plan Rows") or 0))
+        children = node.get("Plans")
+        if children:
+            stack.extend(reversed(children))
+
+    return {
+        "node_types": node_types,
+        "relations": relations,
+        "total_costs": total_costs,
+        "plan_rows": plan_rows
+    }
+
 
 class IssueLevel(Enum):
     """问题级别"""
@@ -45,6 +102,9 @@ class SQLAnalyzer:
         r'\bMAX\s*\(',
     ]
 
+    # 所有分析类模式合并为一个预编译正则，单次扫描即可判定
+    _ANALYTICAL_RE = re.compile("|".join(ANALYTICAL_PATTERNS), re.IGNORECASE)
+
     # 性能问题阈值
     THRESHOLDS = {
         "full_scan_rows": 10000,      # 全表扫描行数阈值（CRITICAL）
@@ -62,16 +122,44 @@ class SQLAnalyzer:
         """
         self.db_type = db_type.lower()
 
+        # 两级分类缓存：精确SQL文本 -> 归一化签名 -> 实际分类
+        self._classify_exact = lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)(self._classify_normalized)
+        self._normalized_cache = OrderedDict()
+        self._normalized_lock = threading.Lock()
+
     def is_analytical_query(self, sql: str) -> bool:
         """
         判断SQL是否为分析类查询
 
+        结果按精确SQL文本和归一化签名两级缓存，重复提交的SQL无需重新分类
+
         Args:
             sql: SQL语句
 
         Returns:
             是否为分析类查询
         """
+        return self._classify_exact(sql)
+
+    def _classify_normalized(self, sql: str) -> bool:
+        """按归一化签名查找分类结果，未命中时实际分类并缓存"""
+        key = normalize_sql(sql)
+        with self._normalized_lock:
+            result = self._normalized_cache.get(key)
+            if result is not None:
+                self._normalized_cache.move_to_end(key)
+                return result
+
+        result = self._classify(sql)
+
+        with self._normalized_lock:
+            self._normalized_cache[key] = result
+            if len(self._normalized_cache) > _CLASSIFY_CACHE_SIZE:
+                self._normalized_cache.popitem(last=False)
+        return result
+
+    def _classify(self, sql: str) -> bool:
+        """判断SQL是否为分析类查询（无缓存）"""
         sql_upper = sql.upper()
 
         # 必须是SELECT查询
@@ -79,9 +167,8 @@ class SQLAnalyzer:
             return False
 
         # 检查是否包含分析类关键词
-        for pattern in self.ANALYTICAL_PATTERNS:
-            if re.search(pattern, sql_upper, re.IGNORECASE):
-                return True
+        if self._ANALYTICAL_RE.search(sql_upper):
+            return True
 
         # 检查是否包含子查询
         if self._has_subquery(sql):
@@ -165,16 +252,61 @@ class SQLAnalyzer:
             "should_confirm": has_critical
         }
 
-    def _parse_postgresql_plan(self, plan: List[str]) -> Tuple[List[Dict], Dict]:
+    def _parse_postgresql_plan(self, plan: Any) -> Tuple[List[Dict], Dict]:
         """
         解析PostgreSQL/GaussDB的EXPLAIN输出
 
         Args:
-            plan: EXPLAIN输出的行列表
+            plan: EXPLAIN输出的行列表，或 FORMAT JSON 的计划树
 
         Returns:
             (issues, performance_summary)
         """
+        if isinstance(plan, (list, dict)) and _json_plan_root(plan) is not None:
+            columns = _flatten_plan_tree(_json_plan_root(plan))
+            total_costs = columns["total_costs"]
+            node_types = columns["node_types"]
+            plan_rows = columns["plan_rows"]
+            relations = columns["relations"]
+
+            total_cost = total_costs[0] if total_costs else None
+            seq_scans = [
+                (relations[i], plan_rows[i])
+                for i, node_type in enumerate(node_types) if node_type == "Seq Scan"
+            ]
+            max_rows = max(plan_rows) if plan_rows else 0
+            nested_loop_rows = [
+                plan_rows[i] for i, node_type in enumerate(node_types) if node_type == "Nested Loop"
+            ]
+        else:
+            plan_text = "\n".join(plan) if isinstance(plan, list) else str(plan)
+
+            # 提取总cost
+            cost_match = re.search(r'cost=[\d.]+\.\.([\d.]+)', plan_text)
+            total_cost = float(cost_match.group(1)) if cost_match else None
+
+            # 检测全表扫描 (Seq Scan)
+            seq_scans = [
+                (match.group(1), int(match.group(2)))
+                for match in re.finditer(r'Seq Scan on (\w+).*?rows=(\d+)', plan_text, re.IGNORECASE | re.DOTALL)
+            ]
+
+            # 预估行数
+            max_rows = 0
+            for match in re.finditer(r'rows=(\d+)', plan_text):
+                max_rows = max(max_rows, int(match.group(1)))
+
+            # 嵌套循环
+            nested_loop_rows = [
+                int(match.group(1))
+                for match in re.finditer(r'Nested Loop.*?rows=(\d+)', plan_text, re.IGNORECASE | re.DOTALL)
+            ]
+
+        return self._build_postgresql_issues(total_cost, seq_scans, max_rows, nested_loop_rows)
+
+    def _build_postgresql_issues(self, total_cost: Any, seq_scans: List[Tuple[str, int]],
+                                 max_rows: int, nested_loop_rows: List[int]) -> Tuple[List[Dict], Dict]:
+        """根据从执行计划中提取的指标生成问题列表"""
         issues = []
         performance_summary = {
             "scan_types": [],
@@ -182,12 +314,8 @@ class SQLAnalyzer:
             "estimated_rows": None
         }
 
-        plan_text = "\n".join(plan) if isinstance(plan, list) else str(plan)
-
-        # 提取总cost
-        cost_match = re.search(r'cost=[\d.]+\.\.([\d.]+)', plan_text)
-        if cost_match:
-            total_cost = float(cost_match.group(1))
+        if total_cost is not None:
+            total_cost = float(total_cost)
             performance_summary["total_cost"] = total_cost
             if total_cost > self.THRESHOLDS["high_cost"]:
                 issues.append({
@@ -197,11 +325,7 @@ class SQLAnalyzer:
                     "suggestion": "考虑添加索引或优化查询条件"
                 })
 
-        # 检测全表扫描 (Seq Scan)
-        seq_scan_pattern = r'Seq Scan on (\w+).*?rows=(\d+)'
-        for match in re.finditer(seq_scan_pattern, plan_text, re.IGNORECASE | re.DOTALL):
-            table_name = match.group(1)
-            rows = int(match.group(2))
+        for table_name, rows in seq_scans:
             performance_summary["scan_types"].append(f"Seq Scan on {table_name}")
 
             if rows > self.THRESHOLDS["full_scan_rows"]:
@@ -215,12 +339,6 @@ class SQLAnalyzer:
                 })
 
         # 检测预估行数过大
-        rows_pattern = r'rows=(\d+)'
-        max_rows = 0
-        for match in re.finditer(rows_pattern, plan_text):
-            rows = int(match.group(1))
-            max_rows = max(max_rows, rows)
-
         performance_summary["estimated_rows"] = max_rows
         if max_rows > self.THRESHOLDS["large_rows"]:
             # 只有在没有全表扫描CRITICAL问题时才添加这个WARNING
@@ -234,9 +352,7 @@ class SQLAnalyzer:
                 })
 
         # 检测嵌套循环
-        nested_loop_pattern = r'Nested Loop.*?rows=(\d+)'
-        for match in re.finditer(nested_loop_pattern, plan_text, re.IGNORECASE | re.DOTALL):
-            rows = int(match.group(1))
+        for rows in nested_loop_rows:
             if rows > self.THRESHOLDS["nested_loop_rows"]:
                 issues.append({
                     "level": IssueLevel.WARNING.value,
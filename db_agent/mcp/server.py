@@ -314,6 +314,8 @@ def init_database(
             'password': password
         }
 
+        if _db_tools is not None:
+            _db_tools.close()
         _db_tools = DatabaseToolsFactory.create(db_type, db_config)
 
         # Test connection
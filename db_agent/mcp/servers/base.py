@@ -40,6 +40,8 @@ def create_db_mcp_server(
 
     def set_db(tools):
         nonlocal _db_tools
+        if _db_tools is not None and _db_tools is not tools:
+            _db_tools.close()
         _db_tools = tools
 
     # ===== Connection Tools =====